@@ -7,11 +7,18 @@ and all tools are working correctly.
 
 import asyncio
 import sys
-from typing import Dict, List
+from types import TracebackType
+from typing import Awaitable, Dict, List, Optional, Self, Tuple, Type, TypeVar
 
+# Importing the tools package at startup makes a broken tool fail the
+# script immediately with a normal traceback
+import src.tools  # noqa: F401
 from src.config import get_config, reset_config
 from src.n8n_client import N8NClient, N8NError
 
+CheckResult = Tuple[str, str, str]
+T = TypeVar("T")
+
 
 class HealthChecker:
     """Health check utility for MCP server."""
@@ -22,6 +29,38 @@ class HealthChecker:
         self.checks_passed = 0
         self.checks_failed = 0
         self.results: List[Dict[str, str]] = []
+        self._client: Optional[N8NClient] = None
+
+    async def __aenter__(self) -> Self:
+        """Open the n8n client shared by all probes."""
+        self._client = await N8NClient(self.config).__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        """Close the shared n8n client."""
+        if self._client:
+            await self._client.__aexit__(exc_type, exc_val, exc_tb)
+            self._client = None
+
+    async def _bounded(self, coro: Awaitable[T]) -> T:
+        """Await a probe, giving up after HEALTH_CHECK_TIMEOUT seconds."""
+        return await asyncio.wait_for(coro, timeout=self.config.health_check_timeout)
+
+    def _timeout_message(self) -> str:
+        """Message reported for a probe that hit the timeout."""
+        return f"Timed out after {self.config.health_check_timeout}s"
+
+    @property
+    def client(self) -> N8NClient:
+        """Shared n8n client (only available inside ``async with``)."""
+        if self._client is None:
+            raise RuntimeError("HealthChecker must be used as an async context manager")
+        return self._client
 
     def print_header(self) -> None:
         """Print health check header."""
@@ -55,123 +94,93 @@ class HealthChecker:
         else:
             self.checks_failed += 1
 
-    async def check_configuration(self) -> None:
+    async def check_configuration(self) -> CheckResult:
         """Check configuration is valid."""
         try:
             # Check required config
             assert self.config.n8n_url, "N8N_URL is not set"
             assert self.config.n8n_api_key, "N8N_API_KEY is not set"
 
-            self.print_result(
+            return (
                 "Configuration",
                 "PASS",
                 f"n8n URL: {self.config.n8n_url}"
             )
         except Exception as e:
-            self.print_result(
+            return (
                 "Configuration",
                 "FAIL",
                 str(e)
             )
 
-    async def check_n8n_connection(self) -> None:
+    async def check_n8n_connection(self) -> CheckResult:
         """Check connection to n8n instance."""
         try:
-            async with N8NClient(self.config) as client:
-                health = await client.health_check()
-                self.print_result(
-                    "n8n Connection",
-                    "PASS",
-                    health.get("message", "Connected successfully")
-                )
+            health = await self._bounded(self.client.health_check())
+            return (
+                "n8n Connection",
+                "PASS",
+                health.get("message", "Connected successfully")
+            )
+        except TimeoutError:
+            return ("n8n Connection", "FAIL", self._timeout_message())
         except Exception as e:
-            self.print_result(
+            return (
                 "n8n Connection",
                 "FAIL",
                 f"Cannot connect to n8n: {str(e)}"
             )
 
-    async def check_workflow_list(self) -> None:
+    async def check_workflow_list(self) -> CheckResult:
         """Check workflow listing works."""
         try:
-            async with N8NClient(self.config) as client:
-                workflows = await client.list_workflows()
-                count = len(workflows)
-                self.print_result(
-                    "Workflow Listing",
-                    "PASS",
-                    f"Found {count} workflow(s)"
-                )
+            workflows = await self._bounded(self.client.list_workflows())
+            count = len(workflows)
+            return (
+                "Workflow Listing",
+                "PASS",
+                f"Found {count} workflow(s)"
+            )
+        except TimeoutError:
+            return ("Workflow Listing", "FAIL", self._timeout_message())
         except Exception as e:
-            self.print_result(
+            return (
                 "Workflow Listing",
                 "FAIL",
                 str(e)
             )
 
-    async def check_api_permissions(self) -> None:
+    async def check_api_permissions(self) -> CheckResult:
         """Check API key has correct permissions."""
         try:
-            async with N8NClient(self.config) as client:
-                # Try to list workflows (read permission)
-                await client.list_workflows()
-
-                # Check if we can get executions (read permission)
-                await client.get_executions(limit=1)
+            # Workflow read permission is already covered by
+            # check_workflow_list, so only probe executions here
+            await self._bounded(self.client.get_executions(limit=1))
 
-                self.print_result(
-                    "API Permissions",
-                    "PASS",
-                    "API key has read permissions"
-                )
+            return (
+                "API Permissions",
+                "PASS",
+                "API key has read permissions"
+            )
+        except TimeoutError:
+            return ("API Permissions", "FAIL", self._timeout_message())
         except N8NError as e:
             if "401" in str(e) or "403" in str(e):
-                self.print_result(
+                return (
                     "API Permissions",
                     "FAIL",
                     "API key invalid or insufficient permissions"
                 )
-            else:
-                self.print_result(
-                    "API Permissions",
-                    "FAIL",
-                    str(e)
-                )
-        except Exception as e:
-            self.print_result(
+            return (
                 "API Permissions",
                 "FAIL",
                 str(e)
             )
-
-    async def check_tools_import(self) -> None:
-        """Check all tools can be imported."""
-        try:
-            from src.tools import (
-                ListWorkflowsTool,
-                GetWorkflowDetailsTool,
-                CreateWorkflowTool,
-                UpdateWorkflowTool,
-                ActivateWorkflowTool,
-                DeactivateWorkflowTool,
-                DeleteWorkflowTool,
-                SearchWorkflowsTool,
-                ExecuteWorkflowTool,
-                GetExecutionsTool,
-                GetWorkflowHealthTool,
-            )
-
-            tool_count = 11
-            self.print_result(
-                "MCP Tools Import",
-                "PASS",
-                f"All {tool_count} tools imported successfully"
-            )
         except Exception as e:
-            self.print_result(
-                "MCP Tools Import",
+            return (
+                "API Permissions",
                 "FAIL",
-                f"Failed to import tools: {str(e)}"
+                str(e)
             )
 
     def print_summary(self) -> None:
@@ -211,12 +220,24 @@ class HealthChecker:
         """
         self.print_header()
 
-        # Run checks
-        await self.check_configuration()
-        await self.check_n8n_connection()
-        await self.check_workflow_list()
-        await self.check_api_permissions()
-        await self.check_tools_import()
+        # Run checks concurrently; results are printed afterwards in
+        # declaration order so the output stays deterministic
+        checks = [
+            ("Configuration", self.check_configuration()),
+            ("n8n Connection", self.check_n8n_connection()),
+            ("Workflow Listing", self.check_workflow_list()),
+            ("API Permissions", self.check_api_permissions()),
+        ]
+        results = await asyncio.gather(
+            *(coro for _, coro in checks),
+            return_exceptions=True
+        )
+
+        for (name, _), result in zip(checks, results):
+            if isinstance(result, BaseException):
+                self.print_result(name, "FAIL", str(result))
+            else:
+                self.print_result(*result)
 
         # Print summary
         self.print_summary()
@@ -227,8 +248,8 @@ class HealthChecker:
 async def main() -> None:
     """Main entry point."""
     try:
-        checker = HealthChecker()
-        success = await checker.run_all_checks()
+        async with HealthChecker() as checker:
+            success = await checker.run_all_checks()
         sys.exit(0 if success else 1)
 
     except KeyboardInterrupt:
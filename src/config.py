@@ -1,14 +1,35 @@
 """Configuration management for MCP server."""
 
 import logging
-from typing import Optional
+from functools import cached_property
+from typing import Annotated, Any, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, HttpUrl, field_validator
+from pydantic import BeforeValidator, Field, HttpUrl, model_validator
 
 
 logger = logging.getLogger(__name__)
 
 
+def _upper(value: Any) -> Any:
+    """Uppercase string values before Literal validation."""
+    return value.upper() if isinstance(value, str) else value
+
+
+def _lower(value: Any) -> Any:
+    """Lowercase string values before Literal validation."""
+    return value.lower() if isinstance(value, str) else value
+
+
+# Accepted values are checked by pydantic's Literal validator; inputs are
+# case-insensitive
+LogLevel = Annotated[
+    Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+    BeforeValidator(_upper)
+]
+LogFormat = Annotated[Literal["json", "console"], BeforeValidator(_lower)]
+ServerMode = Annotated[Literal["stdio", "http"], BeforeValidator(_lower)]
+
+
 class Config(BaseSettings):
     """Application configuration loaded from environment variables.
 
@@ -37,8 +58,55 @@ class Config(BaseSettings):
         description="Maximum number of retries for failed n8n API requests",
         alias="N8N_MAX_RETRIES"
     )
+    n8n_http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for n8n API requests (disable if a proxy in front of n8n does not support it)",
+        alias="N8N_HTTP2"
+    )
+    n8n_exclude_pinned_data: bool = Field(
+        default=True,
+        description="Ask n8n to leave pinned test data out of workflow lists (disable for n8n versions that reject the parameter)",
+        alias="N8N_EXCLUDE_PINNED_DATA"
+    )
+    n8n_max_connections: int = Field(
+        default=100,
+        description="Maximum number of concurrent connections to n8n",
+        alias="N8N_MAX_CONNECTIONS"
+    )
+    n8n_max_keepalive: int = Field(
+        default=100,
+        description="Maximum number of idle keep-alive connections kept open to n8n",
+        alias="N8N_MAX_KEEPALIVE"
+    )
+    n8n_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection to n8n is kept before closing",
+        alias="N8N_KEEPALIVE_EXPIRY"
+    )
+    n8n_max_concurrency: int = Field(
+        default=32,
+        description="Maximum number of n8n requests a bulk operation keeps in flight",
+        alias="N8N_MAX_CONCURRENCY"
+    )
+    # Batching saves round trips only when many lookups arrive together;
+    # every lone lookup still waits out the full window, so it is opt-in
+    n8n_execution_batch_window_ms: float = Field(
+        default=0.0,
+        description="Milliseconds each execution lookup waits to join a batch (0 disables batching)",
+        alias="N8N_EXECUTION_BATCH_WINDOW_MS"
+    )
+    n8n_execution_max_batch: int = Field(
+        default=32,
+        description="Maximum number of execution lookups dispatched together",
+        alias="N8N_EXECUTION_MAX_BATCH"
+    )
 
     # MCP Server Configuration
+    mcp_server_mode: ServerMode = Field(
+        default="stdio",
+        description="MCP transport: 'stdio' (for Claude Desktop) or 'http' (for remote access)",
+        alias="MCP_SERVER_MODE"
+    )
     mcp_server_host: str = Field(
         default="0.0.0.0",
         description="Host to bind MCP server to",
@@ -54,18 +122,38 @@ class Config(BaseSettings):
         description="Port for management REST API",
         alias="MANAGEMENT_API_PORT"
     )
+    sse_keepalive_interval: float = Field(
+        default=15.0,
+        description="Seconds of idle time before an SSE keepalive comment is sent",
+        alias="SSE_KEEPALIVE_INTERVAL"
+    )
+    mcp_http_keepalive_timeout: float = Field(
+        default=75.0,
+        description="Seconds an idle HTTP keep-alive connection to the MCP server stays open",
+        alias="MCP_HTTP_KEEPALIVE_TIMEOUT"
+    )
+    mcp_client_max_size: int = Field(
+        default=10 * 1024 * 1024,
+        description="Maximum request body size in bytes accepted by the MCP HTTP server",
+        alias="MCP_CLIENT_MAX_SIZE"
+    )
 
     # Logging Configuration
-    log_level: str = Field(
+    log_level: LogLevel = Field(
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
         alias="LOG_LEVEL"
     )
-    log_format: str = Field(
+    log_format: LogFormat = Field(
         default="json",
         description="Log format: 'json' or 'console'",
         alias="LOG_FORMAT"
     )
+    enable_access_log: bool = Field(
+        default=False,
+        description="Log every HTTP request handled by the MCP server and Management API",
+        alias="ENABLE_ACCESS_LOG"
+    )
 
     # Security Configuration
     mcp_auth_token: Optional[str] = Field(
@@ -97,6 +185,21 @@ class Config(BaseSettings):
         description="Cache TTL in seconds",
         alias="CACHE_TTL"
     )
+    cache_max_entries: int = Field(
+        default=512,
+        description="Maximum cached n8n responses per cache; least recently used are evicted",
+        alias="CACHE_MAX_ENTRIES"
+    )
+    health_cache_ttl: float = Field(
+        default=3.0,
+        description="Seconds to reuse the last n8n reachability probe in health endpoints",
+        alias="HEALTH_CACHE_TTL"
+    )
+    health_check_timeout: float = Field(
+        default=5.0,
+        description="Upper bound in seconds for a single n8n health probe",
+        alias="HEALTH_CHECK_TIMEOUT"
+    )
 
     # Rate Limiting
     enable_rate_limiting: bool = Field(
@@ -117,47 +220,30 @@ class Config(BaseSettings):
         extra="ignore"
     )
 
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level is valid."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Log level must be one of {valid_levels}")
-        return v_upper
-
-    @field_validator("log_format")
-    @classmethod
-    def validate_log_format(cls, v: str) -> str:
-        """Validate log format is valid."""
-        valid_formats = ["json", "console"]
-        v_lower = v.lower()
-        if v_lower not in valid_formats:
-            raise ValueError(f"Log format must be one of {valid_formats}")
-        return v_lower
-
-    @field_validator("n8n_url")
-    @classmethod
-    def validate_n8n_url(cls, v: str) -> str:
-        """Validate and normalize n8n URL."""
+    @model_validator(mode="after")
+    def normalize_n8n_url(self) -> "Config":
+        """Normalize n8n URL once after all fields are loaded."""
         # Remove trailing slash
-        return v.rstrip("/")
+        self.n8n_url = self.n8n_url.rstrip("/")
+        return self
 
-    def get_n8n_api_base_url(self) -> str:
-        """Get the complete n8n API base URL."""
+    @cached_property
+    def n8n_api_base_url(self) -> str:
+        """Complete n8n API base URL (computed once)."""
         return f"{self.n8n_url}/api/v1"
 
-    def get_n8n_headers(self) -> dict[str, str]:
-        """Get headers for n8n API requests."""
+    @cached_property
+    def n8n_headers(self) -> dict[str, str]:
+        """Headers for n8n API requests (computed once)."""
         return {
             "X-N8N-API-KEY": self.n8n_api_key,
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
 
-    def is_django_integration_enabled(self) -> bool:
-        """Check if Django integration is configured."""
+    @cached_property
+    def django_integration_enabled(self) -> bool:
+        """Whether Django integration is configured (computed once)."""
         return bool(self.django_portal_url and self.django_webhook_token)
 
     def model_post_init(self, __context: object) -> None:
@@ -171,7 +257,7 @@ class Config(BaseSettings):
                 "log_level": self.log_level,
                 "caching_enabled": self.enable_caching,
                 "rate_limiting_enabled": self.enable_rate_limiting,
-                "django_integration": self.is_django_integration_enabled()
+                "django_integration": self.django_integration_enabled
             }
         )
 
@@ -5,22 +5,46 @@ This module provides HTTP endpoints for the Django portal to manage
 and monitor the MCP server without interfering with MCP protocol operations.
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import time
 
-from fastapi import FastAPI, HTTPException, Depends, Header, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 
 from src.config import get_config
-from src.n8n_client import N8NClient, N8NError
+from src.n8n_client import N8NClient, N8NError, aclose_all, get_client
 
 logger = logging.getLogger(__name__)
 
-# Global startup time for uptime tracking
-_startup_time = time.time()
+# Monotonic startup time for uptime tracking (immune to wall-clock changes)
+_startup_monotonic = time.monotonic()
+
+# Last n8n reachability probe, shared by /health and /status
+_last_probe_time = float("-inf")
+_last_probe_error: Optional[str] = None
+_probe_lock = asyncio.Lock()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Attach the process-wide n8n client shared by all requests.
+
+    Reusing one client keeps the httpx connection pool warm instead of
+    paying a TCP/TLS handshake to n8n on every request.
+    """
+    app.state.n8n_client = get_client(get_config())
+    try:
+        yield
+    finally:
+        await aclose_all()
+
 
 # Initialize FastAPI app
 management_app = FastAPI(
@@ -28,7 +52,8 @@ management_app = FastAPI(
     description="REST API for managing the MCP server from Django portal",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 
@@ -42,7 +67,7 @@ class ServerStatus(BaseModel):
     mcp_port: int = Field(..., description="MCP server port")
     management_port: int = Field(..., description="Management API port")
     version: str = Field(..., description="MCP server version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
 class WorkflowStats(BaseModel):
@@ -99,7 +124,14 @@ class ConfigResponse(BaseModel):
 
 
 # Authentication
-async def verify_portal_token(authorization: Optional[str] = Header(None)) -> str:
+# auto_error is off so that a missing or malformed header yields 401
+# (HTTPBearer itself would answer 403) with our own error detail
+_bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def verify_portal_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme)
+) -> str:
     """
     Verify Django portal authentication token.
 
@@ -107,7 +139,8 @@ async def verify_portal_token(authorization: Optional[str] = Header(None)) -> st
     Django portal will send its DRF token here.
 
     Args:
-        authorization: Authorization header value
+        credentials: Bearer credentials parsed by HTTPBearer, or None if
+            the header is missing or does not use the Bearer scheme
 
     Returns:
         The verified token
@@ -115,45 +148,133 @@ async def verify_portal_token(authorization: Optional[str] = Header(None)) -> st
     Raises:
         HTTPException: If authentication fails
     """
-    if not authorization:
+    if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing authorization header"
+            detail="Missing or invalid authorization header. Use 'Bearer <token>'"
         )
 
-    try:
-        scheme, token = authorization.split(maxsplit=1)
-        if scheme.lower() != "bearer":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication scheme. Use 'Bearer <token>'"
-            )
-
-        # In production, verify token against Django portal's API
-        # For now, we accept any non-empty token (Django portal handles its own auth)
-        if not token or len(token) < 10:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token"
-            )
-
-        return token
-    except ValueError:
+    # In production, verify token against Django portal's API
+    # For now, we accept any non-empty token (Django portal handles its own auth)
+    token = credentials.credentials
+    if len(token) < 10:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format. Use 'Bearer <token>'"
+            detail="Invalid token"
         )
 
+    return token
+
+
+def get_n8n_client(request: Request) -> N8NClient:
+    """Get the shared n8n client opened by the app lifespan."""
+    client: N8NClient = request.app.state.n8n_client
+    return client
+
+
+async def probe_n8n(client: N8NClient) -> Optional[str]:
+    """
+    Check n8n reachability, reusing the last result within HEALTH_CACHE_TTL.
+
+    Concurrent callers with a stale result wait on a lock so that only one
+    of them probes n8n. The probe itself is bounded by HEALTH_CHECK_TIMEOUT.
+
+    Args:
+        client: Shared n8n client
 
-def get_n8n_client() -> N8NClient:
-    """Get initialized n8n client."""
+    Returns:
+        None if n8n is reachable, otherwise the error message
+    """
+    global _last_probe_time, _last_probe_error
     config = get_config()
-    return N8NClient(config)
+    ttl = config.health_cache_ttl
+
+    if time.monotonic() - _last_probe_time < ttl:
+        return _last_probe_error
+
+    async with _probe_lock:
+        # Another request may have refreshed the probe while we waited
+        if time.monotonic() - _last_probe_time < ttl:
+            return _last_probe_error
+
+        try:
+            # Bound the probe so a hung n8n cannot stall the endpoint
+            await asyncio.wait_for(
+                client.health_check(),
+                timeout=config.health_check_timeout
+            )
+            _last_probe_error = None
+        except TimeoutError:
+            _last_probe_error = f"n8n timeout after {config.health_check_timeout}s"
+        except Exception as e:
+            _last_probe_error = str(e)
+        _last_probe_time = time.monotonic()
+
+    return _last_probe_error
+
+
+def reset_probe_cache() -> None:
+    """Reset the cached n8n probe (mainly for testing)."""
+    global _last_probe_time, _last_probe_error
+    _last_probe_time = float("-inf")
+    _last_probe_error = None
+
+
+async def _count_workflows(client: N8NClient) -> Tuple[int, int]:
+    """
+    Count workflows page by page without keeping the full list.
+
+    Args:
+        client: Shared n8n client
+
+    Returns:
+        Tuple of (total workflows, active workflows)
+    """
+    total = active = 0
+    async for workflow in client.iter_workflows():
+        total += 1
+        if workflow.get("active", False):
+            active += 1
+    return total, active
+
+
+async def _today_execution_stats(client: N8NClient) -> Tuple[int, float, int]:
+    """
+    Summarize today's executions.
+
+    n8n lists executions newest first, so pages are streamed without their
+    execution data until the first execution started before today.
+
+    Args:
+        client: Shared n8n client
+
+    Returns:
+        Tuple of (executions today, success rate in percent,
+        number of workflows with a failed execution today)
+    """
+    today = datetime.now(UTC).date().isoformat()
+
+    total = succeeded = 0
+    failed_workflows = set()
+    async for execution in client.iter_executions(page_size=250):
+        started_at = execution.get("startedAt")
+        if not started_at:
+            continue
+        if started_at[:10] < today:
+            break
+        total += 1
+        if execution.get("finished"):
+            succeeded += 1
+        elif execution.get("stoppedAt"):
+            failed_workflows.add(execution.get("workflowId"))
+
+    success_rate = round(succeeded / total * 100, 2) if total else 0.0
+    return total, success_rate, len(failed_workflows)
 
 
 # CORS Configuration
-def setup_cors():
-    """Configure CORS middleware for Django portal."""
+def _build_allowed_origins() -> Tuple[str, ...]:
+    """Build the origins allowed to call the API from the Django portal."""
     config = get_config()
 
     # Default allowed origins
@@ -166,17 +287,32 @@ def setup_cors():
     if config.django_portal_url:
         allowed_origins.append(config.django_portal_url)
 
+    return tuple(allowed_origins)
+
+
+# Origins do not change at runtime, so compute them once at import
+_ALLOWED_ORIGINS = _build_allowed_origins()
+
+
+def setup_cors():
+    """Configure CORS middleware for Django portal."""
     management_app.add_middleware(
         CORSMiddleware,
-        allow_origins=allowed_origins,
+        allow_origins=_ALLOWED_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
 
-# Call CORS setup
+def setup_compression() -> None:
+    """Compress larger JSON responses (e.g. workflow lists) for the portal."""
+    management_app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+# Call middleware setup
 setup_cors()
+setup_compression()
 
 
 # Endpoints
@@ -193,26 +329,19 @@ async def root():
 
 
 @management_app.get("/health", response_model=HealthCheck, tags=["Monitoring"])
-async def health_check():
+async def health_check(client: N8NClient = Depends(get_n8n_client)):
     """
     Health check endpoint (no auth required).
     Used by Docker healthcheck and monitoring systems.
     """
-    config = get_config()
     errors = []
-    n8n_reachable = False
 
-    try:
-        client = N8NClient(config)
-        try:
-            # Test n8n connection
-            await client.health_check()
-            n8n_reachable = True
-        finally:
-            await client.close()
-    except Exception as e:
-        errors.append(f"n8n unreachable: {str(e)}")
-        logger.warning(f"Health check: n8n unreachable - {e}")
+    # Test n8n connection
+    probe_error = await probe_n8n(client)
+    n8n_reachable = probe_error is None
+    if probe_error is not None:
+        errors.append(f"n8n unreachable: {probe_error}")
+        logger.warning(f"Health check: n8n unreachable - {probe_error}")
 
     healthy = n8n_reachable and len(errors) == 0
 
@@ -224,26 +353,23 @@ async def health_check():
 
 
 @management_app.get("/status", response_model=ServerStatus, tags=["Monitoring"])
-async def get_status(token: str = Depends(verify_portal_token)):
+async def get_status(
+    token: str = Depends(verify_portal_token),
+    client: N8NClient = Depends(get_n8n_client)
+):
     """
     Get comprehensive server status.
     Requires authentication.
     """
     config = get_config()
-    n8n_connected = False
 
-    try:
-        client = N8NClient(config)
-        try:
-            await client.health_check()
-            n8n_connected = True
-        finally:
-            await client.close()
-    except Exception as e:
-        logger.warning(f"Status check: n8n connection failed - {e}")
+    probe_error = await probe_n8n(client)
+    n8n_connected = probe_error is None
+    if probe_error is not None:
+        logger.warning(f"Status check: n8n connection failed - {probe_error}")
 
     # Calculate uptime
-    uptime = time.time() - _startup_time
+    uptime = time.monotonic() - _startup_monotonic
 
     return ServerStatus(
         status="operational" if n8n_connected else "degraded",
@@ -257,27 +383,32 @@ async def get_status(token: str = Depends(verify_portal_token)):
 
 
 @management_app.get("/workflows/stats", response_model=WorkflowStats, tags=["Workflows"])
-async def get_workflow_stats(token: str = Depends(verify_portal_token)):
+async def get_workflow_stats(
+    token: str = Depends(verify_portal_token),
+    client: N8NClient = Depends(get_n8n_client)
+):
     """
     Get aggregated workflow statistics.
     Requires authentication.
     """
-    config = get_config()
-    client = N8NClient(config)
-
     try:
-        workflows = await client.list_workflows()
+        # Workflow counts and execution history are independent n8n calls
+        workflow_counts, execution_stats = await asyncio.gather(
+            _count_workflows(client),
+            _today_execution_stats(client),
+            return_exceptions=True
+        )
+        if isinstance(workflow_counts, BaseException):
+            raise workflow_counts
 
-        total = len(workflows)
-        active = sum(1 for w in workflows if w.get("active", False))
+        total, active = workflow_counts
         paused = total - active
 
-        # TODO: Implement error detection based on recent execution failures
-        error = 0
-
-        # TODO: Get today's execution count (requires execution history API)
-        executions_today = 0
-        success_rate = 0.0
+        # Execution metrics are best-effort; workflow counts are still useful
+        if isinstance(execution_stats, BaseException):
+            logger.warning(f"Failed to fetch execution stats: {execution_stats}")
+            execution_stats = (0, 0.0, 0)
+        executions_today, success_rate, error = execution_stats
 
         return WorkflowStats(
             total_workflows=total,
@@ -293,13 +424,12 @@ async def get_workflow_stats(token: str = Depends(verify_portal_token)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch workflow stats: {str(e)}"
         )
-    finally:
-        await client.close()
 
 
 @management_app.get("/workflows", response_model=WorkflowListResponse, tags=["Workflows"])
 async def list_workflows(
     token: str = Depends(verify_portal_token),
+    client: N8NClient = Depends(get_n8n_client),
     active_only: bool = False,
     search: Optional[str] = None
 ):
@@ -309,18 +439,13 @@ async def list_workflows(
 
     Args:
         token: Authentication token
+        client: Shared n8n client
         active_only: Only return active workflows
         search: Search by workflow name
     """
-    config = get_config()
-    client = N8NClient(config)
-
     try:
-        workflows = await client.list_workflows()
-
-        # Filter active only
-        if active_only:
-            workflows = [w for w in workflows if w.get("active", False)]
+        # Let n8n filter by active status so inactive workflows are never sent
+        workflows = await client.list_workflows(active=True if active_only else None)
 
         # Search by name
         if search:
@@ -330,29 +455,26 @@ async def list_workflows(
                 if search_lower in w.get("name", "").lower()
             ]
 
-        return WorkflowListResponse(workflows=workflows, count=len(workflows))
+        # FastAPI validates and serializes this through response_model
+        return {"workflows": workflows, "count": len(workflows)}
     except N8NError as e:
         logger.error(f"Failed to list workflows: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list workflows: {str(e)}"
         )
-    finally:
-        await client.close()
 
 
 @management_app.get("/workflows/{workflow_id}", tags=["Workflows"])
 async def get_workflow(
     workflow_id: str,
-    token: str = Depends(verify_portal_token)
+    token: str = Depends(verify_portal_token),
+    client: N8NClient = Depends(get_n8n_client)
 ):
     """
     Get detailed information about a specific workflow.
     Requires authentication.
     """
-    config = get_config()
-    client = N8NClient(config)
-
     try:
         workflow = await client.get_workflow(workflow_id)
         return {"success": True, "workflow": workflow}
@@ -362,8 +484,6 @@ async def get_workflow(
             status_code=status.HTTP_404_NOT_FOUND if "not found" in str(e).lower() else status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
-    finally:
-        await client.close()
 
 
 @management_app.post(
@@ -373,15 +493,13 @@ async def get_workflow(
 )
 async def activate_workflow(
     workflow_id: str,
-    token: str = Depends(verify_portal_token)
+    token: str = Depends(verify_portal_token),
+    client: N8NClient = Depends(get_n8n_client)
 ):
     """
     Activate a workflow.
     Requires authentication.
     """
-    config = get_config()
-    client = N8NClient(config)
-
     try:
         result = await client.activate_workflow(workflow_id)
         return WorkflowActionResponse(
@@ -395,8 +513,6 @@ async def activate_workflow(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to activate workflow: {str(e)}"
         )
-    finally:
-        await client.close()
 
 
 @management_app.post(
@@ -406,15 +522,13 @@ async def activate_workflow(
 )
 async def deactivate_workflow(
     workflow_id: str,
-    token: str = Depends(verify_portal_token)
+    token: str = Depends(verify_portal_token),
+    client: N8NClient = Depends(get_n8n_client)
 ):
     """
     Deactivate a workflow.
     Requires authentication.
     """
-    config = get_config()
-    client = N8NClient(config)
-
     try:
         result = await client.deactivate_workflow(workflow_id)
         return WorkflowActionResponse(
@@ -428,8 +542,6 @@ async def deactivate_workflow(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to deactivate workflow: {str(e)}"
         )
-    finally:
-        await client.close()
 
 
 @management_app.post(
@@ -439,15 +551,13 @@ async def deactivate_workflow(
 )
 async def execute_workflow(
     workflow_id: str,
-    token: str = Depends(verify_portal_token)
+    token: str = Depends(verify_portal_token),
+    client: N8NClient = Depends(get_n8n_client)
 ):
     """
     Manually trigger workflow execution.
     Requires authentication.
     """
-    config = get_config()
-    client = N8NClient(config)
-
     try:
         result = await client.execute_workflow(workflow_id)
         return ExecutionResponse(
@@ -461,8 +571,6 @@ async def execute_workflow(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to execute workflow: {str(e)}"
         )
-    finally:
-        await client.close()
 
 
 @management_app.get("/config", response_model=ConfigResponse, tags=["Configuration"])
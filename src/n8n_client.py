@@ -1,44 +1,105 @@
 """Async client for n8n API interactions."""
 
+import asyncio
+import importlib.util
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Self,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
 import httpx
+import orjson
 from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
+    AsyncRetrying,
+    before_sleep_log,
     retry_if_exception_type,
-    before_sleep_log
+    stop_after_attempt,
+    wait_random_exponential,
 )
 
-from src.config import Config
+from src.config import Config, get_config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Health check request as (method, endpoint, query params)
+HealthProbe = Tuple[str, str, Optional[Dict[str, Any]]]
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Methods that are safe to resend when the response was lost
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Transport failures worth retrying for idempotent methods
+_RETRYABLE_ERRORS = (httpx.NetworkError, httpx.TimeoutException)
+
+# Workflow fields maintained by n8n that must not be sent back on update
+_READ_ONLY_WORKFLOW_FIELDS = frozenset({"id", "createdAt", "updatedAt", "versionId"})
+
+# Fields sent by a full workflow update, with the value used when missing
+_WORKFLOW_UPDATE_DEFAULTS: Dict[str, Any] = {
+    "name": None,
+    "nodes": [],
+    "connections": {},
+    "settings": {},
+    "tags": [],
+    "active": False,
+}
+
 
 class N8NError(Exception):
     """Base exception for n8n client errors."""
-    pass
 
 
 class N8NConnectionError(N8NError):
     """Raised when connection to n8n fails."""
-    pass
 
 
 class N8NAuthError(N8NError):
     """Raised when authentication fails."""
-    pass
 
 
 class N8NNotFoundError(N8NError):
     """Raised when a resource is not found."""
-    pass
 
 
 class N8NValidationError(N8NError):
     """Raised when request validation fails."""
-    pass
+
+
+class N8NUnsupportedError(N8NError):
+    """Raised when n8n does not support the requested method."""
+
+
+# Status code -> (exception, log level, log label, exception message label)
+_STATUS_ERRORS: Dict[int, Tuple[type, int, str, str]] = {
+    400: (N8NValidationError, logging.WARNING, "Validation error", "Validation error"),
+    401: (N8NAuthError, logging.ERROR, "Authentication error", "Authentication failed"),
+    403: (N8NAuthError, logging.ERROR, "Authentication error", "Authentication failed"),
+    404: (N8NNotFoundError, logging.WARNING, "Resource not found", "Resource not found"),
+    405: (N8NUnsupportedError, logging.WARNING, "Method not allowed", "Method not allowed"),
+}
+_DEFAULT_STATUS_ERROR = (N8NError, logging.ERROR, "n8n API error", "n8n API error")
 
 
 class N8NClient:
@@ -47,40 +108,91 @@ class N8NClient:
     This client provides methods for managing workflows and executions
     in n8n with proper error handling, retries, and logging.
 
+    Workflow reads (``list_workflows`` and ``get_workflow``) are cached for
+    ``CACHE_TTL`` seconds when ``ENABLE_CACHING`` is on, and the cache is
+    invalidated by every workflow mutation made through this client.
+    Cached objects are shared between callers and must not be mutated.
+
     Attributes:
         config: Configuration instance
         client: Async HTTP client
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> None:
         """Initialize n8n client.
 
         Args:
             config: Application configuration
+            transport: Transport for the underlying HTTP client, e.g. an
+                httpx.MockTransport in tests; defaults to a connection pool
         """
         self.config = config
-        self.base_url = config.get_n8n_api_base_url()
-        self.headers = config.get_n8n_headers()
+        self.base_url = config.n8n_api_base_url
+        self.headers = config.n8n_headers
         self.timeout = config.n8n_timeout
 
-        # Create async HTTP client
+        http2 = config.n8n_http2 and _HTTP2_AVAILABLE
+        if config.n8n_http2 and not _HTTP2_AVAILABLE:
+            logger.warning("N8N_HTTP2 is enabled but h2 is not installed, using HTTP/1.1")
+
+        # Create async HTTP client; HTTP/2 multiplexes concurrent requests
+        # (e.g. gathered health and stats calls) over a single connection
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=self.headers,
             timeout=self.timeout,
-            follow_redirects=True
+            follow_redirects=True,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.n8n_max_connections,
+                max_keepalive_connections=config.n8n_max_keepalive,
+                keepalive_expiry=config.n8n_keepalive_expiry
+            ),
+            transport=transport
         )
 
+        # Workflow read caches: key -> (monotonic fetch time, value)
+        self._workflows_cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._workflow_cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[Hashable, asyncio.Lock] = {}
+        self._cache_generation = 0
+        # ETags of cached entries, keyed like the caches, see _fetch_workflow
+        self._etags: Dict[Hashable, str] = {}
+
+        # In-flight GET requests keyed by (endpoint, params), see _request
+        self._inflight: Dict[Hashable, asyncio.Future[Any]] = {}
+
+        # Health probe found to work on this n8n instance, see health_check
+        self._health_probe: Optional[HealthProbe] = None
+
+        # Whether n8n accepts PATCH on workflows (None until tried), see
+        # patch_workflow
+        self._patch_supported: Optional[bool] = None
+
+        # Pending execution lookups, see get_execution
+        self._execution_queue: List[Tuple[str, asyncio.Future[Any]]] = []
+        self._execution_flush: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task[None]] = set()
+
         logger.info(
             "N8N client initialized",
             extra={"base_url": self.base_url}
         )
 
-    async def __aenter__(self) -> "N8NClient":
+    async def __aenter__(self) -> Self:
         """Async context manager entry."""
         return self
 
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
         """Async context manager exit."""
         await self.close()
 
@@ -102,54 +214,53 @@ class N8NClient:
             N8NAuthError: On 401/403 errors
             N8NNotFoundError: On 404 errors
             N8NValidationError: On 400 errors
+            N8NUnsupportedError: On 405 errors
             N8NError: On other errors
         """
-        try:
-            response.raise_for_status()
+        status_code = response.status_code
 
+        # Fast path: successful responses skip all error handling
+        if 200 <= status_code < 300:
             # Handle empty responses
-            if response.status_code == 204 or not response.content:
+            if status_code == 204 or not response.content:
                 return {}
 
-            return response.json()
+            # orjson parses the raw bytes directly, which is much faster than
+            # httpx's stdlib-based response.json() on large execution payloads
+            return orjson.loads(response.content)
 
+        try:
+            response.raise_for_status()
+            error_msg = f"Unexpected HTTP status {status_code}"
         except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
+            error_msg = str(e)
+
+        # Prefer the error message from the response body
+        try:
+            error_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            error_data = None
+        if isinstance(error_data, dict):
+            error_msg = error_data.get("message", error_msg)
+
+        # Raise specific exceptions based on status code
+        exc_cls, level, log_label, error_label = _STATUS_ERRORS.get(
+            status_code, _DEFAULT_STATUS_ERROR
+        )
+        logger.log(level, "%s: %s", log_label, error_msg)
+        raise exc_cls(f"{error_label}: {error_msg}")
 
-            # Try to get error message from response
-            try:
-                error_data = e.response.json()
-                error_msg = error_data.get("message", str(e))
-            except Exception:
-                error_msg = str(e)
-
-            # Raise specific exceptions based on status code
-            if status_code in (401, 403):
-                logger.error(f"Authentication error: {error_msg}")
-                raise N8NAuthError(f"Authentication failed: {error_msg}")
-            elif status_code == 404:
-                logger.warning(f"Resource not found: {error_msg}")
-                raise N8NNotFoundError(f"Resource not found: {error_msg}")
-            elif status_code == 400:
-                logger.warning(f"Validation error: {error_msg}")
-                raise N8NValidationError(f"Validation error: {error_msg}")
-            else:
-                logger.error(f"n8n API error: {error_msg}")
-                raise N8NError(f"n8n API error: {error_msg}")
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.NetworkError, httpx.TimeoutException)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
     async def _request(
         self,
         method: str,
         endpoint: str,
         **kwargs: Any
     ) -> Any:
-        """Make HTTP request with retry logic.
+        """Make HTTP request, sharing identical in-flight GET requests.
+
+        Concurrent GETs for the same endpoint and query parameters are
+        collapsed into a single request whose result (or error) is handed
+        to every caller. GETs that pass their own headers are never shared.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -163,19 +274,209 @@ class N8NClient:
             N8NConnectionError: On connection errors
             Various N8NError subclasses: On API errors
         """
-        try:
-            logger.debug(
-                f"n8n API request: {method} {endpoint}",
-                extra={"method": method, "endpoint": endpoint}
+        # Requests carrying their own headers (e.g. conditional GETs) may
+        # get different answers, so only plain GETs are shared
+        if method != "GET" or kwargs.get("headers"):
+            return await self._send(method, endpoint, **kwargs)
+
+        # QueryParams encodes list values too, which a sorted tuple of
+        # the raw dict items could not hash
+        key = (endpoint, str(httpx.QueryParams(kwargs.get("params") or {})))
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, endpoint, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done: self._inflight.pop(key, None)
+                if self._inflight.get(key) is done else None
             )
 
-            response = await self.client.request(method, endpoint, **kwargs)
-            return self._handle_response(response)
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any
+    ) -> Any:
+        """Send a single HTTP request with retry logic.
+
+        Only idempotent methods are retried on network errors, with
+        jittered exponential backoff, up to ``N8N_MAX_RETRIES`` times. A POST
+        whose response was lost may already have been applied by n8n, so it
+        is never resent.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without base URL)
+            **kwargs: Additional arguments for httpx request
 
-        except (httpx.NetworkError, httpx.TimeoutException) as e:
-            logger.error(f"Connection error to n8n: {e}")
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            N8NConnectionError: On connection errors
+            Various N8NError subclasses: On API errors
+        """
+        return self._handle_response(await self._send_raw(method, endpoint, **kwargs))
+
+    async def _send_raw(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """Send a single HTTP request with retry logic, without parsing it.
+
+        See _send for the retry policy.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without base URL)
+            **kwargs: Additional arguments for httpx request
+
+        Returns:
+            Raw HTTP response, whatever its status
+
+        Raises:
+            N8NConnectionError: On connection errors
+        """
+        if "json" in kwargs:
+            # Encode bodies with orjson rather than httpx's stdlib json; the
+            # client's default headers already declare application/json
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "n8n API request: %s %s", method, endpoint,
+                    extra={"method": method, "endpoint": endpoint}
+                )
+
+            if method in _IDEMPOTENT_METHODS:
+                retrying = AsyncRetrying(
+                    stop=stop_after_attempt(self.config.n8n_max_retries + 1),
+                    wait=wait_random_exponential(multiplier=1, max=10),
+                    retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+                    before_sleep=before_sleep_log(logger, logging.WARNING),
+                    reraise=True
+                )
+                return await retrying(self.client.request, method, endpoint, **kwargs)
+            return await self.client.request(method, endpoint, **kwargs)
+
+        except _RETRYABLE_ERRORS as e:
+            logger.error("Connection error to n8n: %s", e)
             raise N8NConnectionError(f"Failed to connect to n8n: {e}")
 
+    # ==================== Caching ====================
+
+    async def _cached(
+        self,
+        cache: Dict[Hashable, Tuple[float, Any]],
+        key: Hashable,
+        fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return a cached value, fetching it when missing or expired.
+
+        Concurrent misses for the same key wait on a per-key lock so that
+        only one of them hits n8n. Each cache holds at most
+        ``CACHE_MAX_ENTRIES`` entries; the least recently used are evicted.
+
+        Args:
+            cache: Cache dictionary to read from and store into
+            key: Cache key
+            fetch: Coroutine factory producing a fresh value
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        if not self.config.enable_caching:
+            return await fetch()
+
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.config.cache_ttl:
+            # Dicts keep insertion order, so re-inserting marks it most recent
+            cache[key] = cache.pop(key, entry)
+            return cast(T, entry[1])
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another waiter may have refreshed the entry meanwhile
+            entry = cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.config.cache_ttl:
+                return cast(T, entry[1])
+
+            generation = self._cache_generation
+            value = await fetch()
+            if self._cache_generation != generation:
+                # A mutation landed mid-fetch, so the value may predate it
+                return value
+            cache.pop(key, None)
+            cache[key] = (time.monotonic(), value)
+            self._evict(cache)
+            return value
+
+    def _evict(self, cache: Dict[Hashable, Tuple[float, Any]]) -> None:
+        """Drop least recently used entries beyond ``CACHE_MAX_ENTRIES``.
+
+        Args:
+            cache: Cache dictionary to trim
+        """
+        while len(cache) > self.config.cache_max_entries:
+            oldest = next(iter(cache))
+            del cache[oldest]
+            self._etags.pop(oldest, None)
+            lock = self._cache_locks.get(oldest)
+            if lock is not None and not lock.locked():
+                del self._cache_locks[oldest]
+
+    def invalidate_workflow_cache(self, workflow_id: Optional[str] = None) -> None:
+        """Drop cached workflow lists and, optionally, one cached workflow.
+
+        Args:
+            workflow_id: Workflow whose cached details should be dropped
+        """
+        self._cache_generation += 1
+        # Later reads must not join a GET sent before the mutation
+        self._inflight.clear()
+        self._workflows_cache.clear()
+        if workflow_id is not None:
+            self._workflow_cache.pop(("workflow", workflow_id), None)
+            self._etags.pop(("workflow", workflow_id), None)
+
+    def peek_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Return a workflow from the cache without fetching it.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            The cached workflow, or None if it is not cached or has expired
+        """
+        if not self.config.enable_caching:
+            return None
+
+        entry = self._workflow_cache.get(("workflow", workflow_id))
+        if entry is None or time.monotonic() - entry[0] >= self.config.cache_ttl:
+            return None
+        return cast(Dict[str, Any], entry[1])
+
+    @property
+    def cache_generation(self) -> Optional[int]:
+        """Counter bumped every time cached workflow data is invalidated.
+
+        Callers caching results derived from workflow reads can store it
+        with each entry and treat the entry as stale once it changes.
+
+        Returns:
+            Current generation, or None when caching is disabled
+        """
+        if not self.config.enable_caching:
+            return None
+        return self._cache_generation
+
     # ==================== Health & Status ====================
 
     async def health_check(self) -> Dict[str, Any]:
@@ -188,16 +489,54 @@ class N8NClient:
             N8NConnectionError: If health check fails
         """
         try:
-            # Try to list workflows as health check
-            await self._request("GET", "/workflows", params={"limit": 1})
+            if self._health_probe is None:
+                self._health_probe = await self._discover_health_probe()
+            else:
+                method, endpoint, params = self._health_probe
+                await self._request(method, endpoint, params=params)
             return {
                 "status": "healthy",
                 "url": self.base_url,
                 "message": "Successfully connected to n8n"
             }
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            raise N8NConnectionError(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
+            raise N8NConnectionError(f"Health check failed: {e}") from e
+
+    async def _discover_health_probe(self) -> HealthProbe:
+        """Find the cheapest health probe this n8n instance supports.
+
+        Tries ``HEAD /workflows`` and falls back to the original
+        ``GET /workflows?limit=1``. Both go through the authenticated API,
+        so an invalid API key fails the check; n8n's unauthenticated
+        ``/healthz`` only shows the process is up and is not used. A HEAD
+        that is missing or unsupported falls through to the GET; connection
+        and authentication failures are raised immediately.
+
+        Returns:
+            The first probe that succeeded
+
+        Raises:
+            N8NError: If the last-resort probe fails
+        """
+        probes: Tuple[HealthProbe, ...] = (
+            ("HEAD", "/workflows", None),
+            ("GET", "/workflows", {"limit": 1}),
+        )
+
+        for probe in probes[:-1]:
+            method, endpoint, params = probe
+            try:
+                await self._request(method, endpoint, params=params)
+                return probe
+            except (N8NConnectionError, N8NAuthError):
+                raise
+            except N8NError as e:
+                logger.debug("Health probe %s %s unavailable: %s", method, endpoint, e)
+
+        method, endpoint, params = probes[-1]
+        await self._request(method, endpoint, params=params)
+        return probes[-1]
 
     # ==================== Workflow Management ====================
 
@@ -218,10 +557,19 @@ class N8NClient:
         Raises:
             N8NError: On API errors
         """
-        params: Dict[str, Any] = {}
+        return await self._cached(
+            self._workflows_cache,
+            ("workflows", active, tuple(tags) if tags else None),
+            lambda: self._fetch_workflows(active, tags)
+        )
 
-        if active is not None:
-            params["active"] = str(active).lower()
+    async def _fetch_workflows(
+        self,
+        active: Optional[bool],
+        tags: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """Fetch the workflow list from n8n, bypassing the cache."""
+        params = self._workflow_list_params(active)
 
         if tags:
             params["tags"] = ",".join(tags)
@@ -229,6 +577,7 @@ class N8NClient:
         response = await self._request("GET", "/workflows", params=params)
 
         # n8n returns data in different formats, handle both
+        workflows: List[Dict[str, Any]]
         if isinstance(response, dict) and "data" in response:
             workflows = response["data"]
         elif isinstance(response, list):
@@ -236,9 +585,100 @@ class N8NClient:
         else:
             workflows = []
 
-        logger.info(f"Listed {len(workflows)} workflows")
+        logger.info("Listed %d workflows", len(workflows))
         return workflows
 
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the items of a cursor-paginated list endpoint.
+
+        Follows n8n's ``nextCursor`` so only one page is held in memory.
+        Pages are requested lazily, so a caller that stops iterating early
+        never downloads the remaining pages.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Additional query parameters
+            page_size: Number of items requested per page
+
+        Yields:
+            Items from the ``data`` field of each page
+
+        Raises:
+            N8NError: On API errors
+        """
+        params = {**(params or {}), "limit": page_size}
+
+        while True:
+            response = await self._request("GET", endpoint, params=params)
+
+            if isinstance(response, dict):
+                for item in response.get("data", []):
+                    yield item
+                cursor = response.get("nextCursor")
+            else:
+                for item in response or []:
+                    yield item
+                cursor = None
+
+            if not cursor:
+                break
+            # A new dict per page, so earlier requests keep their own params
+            params = {**params, "cursor": cursor}
+
+    async def iter_workflows(
+        self,
+        active: Optional[bool] = None,
+        page_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over workflows one page at a time.
+
+        Suits callers that aggregate or stop at the first match rather than
+        return the full list.
+
+        Args:
+            active: Filter by active status (True/False/None for all)
+            page_size: Number of workflows requested per page
+
+        Yields:
+            Workflow objects
+
+        Raises:
+            N8NError: On API errors
+        """
+        params = self._workflow_list_params(active)
+
+        async for workflow in self._paginate("/workflows", params, page_size):
+            yield workflow
+
+    def _workflow_list_params(self, active: Optional[bool]) -> Dict[str, Any]:
+        """Build the query parameters shared by workflow list requests.
+
+        The n8n API has no field projection for workflows, so the biggest
+        avoidable part of each listed workflow, its pinned test data, is
+        excluded unless ``N8N_EXCLUDE_PINNED_DATA`` is off. Responses are
+        compressed by default via httpx's ``Accept-Encoding``.
+
+        Args:
+            active: Filter by active status (True/False/None for all)
+
+        Returns:
+            Query parameters
+        """
+        params: Dict[str, Any] = {}
+
+        if active is not None:
+            params["active"] = str(active).lower()
+
+        if self.config.n8n_exclude_pinned_data:
+            params["excludePinnedData"] = "true"
+
+        return params
+
     async def get_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific workflow.
 
@@ -252,8 +692,56 @@ class N8NClient:
             N8NNotFoundError: If workflow doesn't exist
             N8NError: On other API errors
         """
-        workflow = await self._request("GET", f"/workflows/{workflow_id}")
-        logger.info(f"Retrieved workflow: {workflow_id}")
+        workflow = await self._cached(
+            self._workflow_cache,
+            ("workflow", workflow_id),
+            lambda: self._fetch_workflow(workflow_id)
+        )
+        logger.info("Retrieved workflow: %s", workflow_id)
+        return workflow
+
+    async def _fetch_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Fetch a workflow, revalidating an expired cached copy if present.
+
+        The response's ETag is remembered for every fetch. An expired copy
+        is revalidated with ``If-None-Match`` (when n8n sent an ETag before)
+        and ``If-Modified-Since`` (from its ``updatedAt``), so an unchanged
+        workflow costs a ``304 Not Modified`` instead of the full definition.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Workflow object with full details
+        """
+        key = ("workflow", workflow_id)
+        endpoint = f"/workflows/{workflow_id}"
+
+        stale = self._workflow_cache.get(key)
+        headers: Dict[str, str] = {}
+        if stale is not None:
+            etag = self._etags.get(key)
+            if etag:
+                headers["If-None-Match"] = etag
+            updated_at = stale[1].get("updatedAt")
+            if updated_at:
+                try:
+                    modified = datetime.fromisoformat(updated_at).astimezone(UTC)
+                    headers["If-Modified-Since"] = format_datetime(modified, usegmt=True)
+                except (TypeError, ValueError):
+                    pass
+
+        response = await self._send_raw("GET", endpoint, headers=headers)
+        if stale is not None and response.status_code == 304:
+            logger.debug("Workflow %s not modified, reusing cached copy", workflow_id)
+            return cast(Dict[str, Any], stale[1])
+
+        workflow: Dict[str, Any] = self._handle_response(response)
+        etag = response.headers.get("etag")
+        if etag:
+            self._etags[key] = etag
+        else:
+            self._etags.pop(key, None)
         return workflow
 
     async def create_workflow(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -269,8 +757,9 @@ class N8NClient:
             N8NValidationError: If workflow data is invalid
             N8NError: On other API errors
         """
-        workflow = await self._request("POST", "/workflows", json=workflow_data)
-        logger.info(f"Created workflow: {workflow.get('id')}")
+        workflow: Dict[str, Any] = await self._request("POST", "/workflows", json=workflow_data)
+        self.invalidate_workflow_cache()
+        logger.info("Created workflow: %s", workflow.get("id"))
         return workflow
 
     async def update_workflow(
@@ -292,12 +781,89 @@ class N8NClient:
             N8NValidationError: If workflow data is invalid
             N8NError: On other API errors
         """
-        workflow = await self._request(
+        workflow: Dict[str, Any] = await self._request(
             "PUT",
             f"/workflows/{workflow_id}",
             json=workflow_data
         )
-        logger.info(f"Updated workflow: {workflow_id}")
+        self.invalidate_workflow_cache(workflow_id)
+        logger.info("Updated workflow: %s", workflow_id)
+        return workflow
+
+    async def patch_workflow(
+        self,
+        workflow_id: str,
+        partial_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Update only the given fields of a workflow.
+
+        Sends the changed fields in a single PATCH request. If n8n rejects
+        PATCH, the current workflow is fetched from n8n, bypassing the
+        cache, merged with the changes and written back with PUT; once PATCH
+        has been rejected it is not tried again.
+
+        Args:
+            workflow_id: Workflow ID to update
+            partial_data: Workflow fields to change
+
+        Returns:
+            Updated workflow object
+
+        Raises:
+            N8NNotFoundError: If workflow doesn't exist
+            N8NValidationError: If workflow data is invalid
+            N8NError: On other API errors
+        """
+        if self._patch_supported is not False:
+            try:
+                workflow: Dict[str, Any] = await self._request(
+                    "PATCH",
+                    f"/workflows/{workflow_id}",
+                    json=partial_data
+                )
+                self._patch_supported = True
+                self.invalidate_workflow_cache(workflow_id)
+                logger.info("Patched workflow: %s", workflow_id)
+                return workflow
+            except N8NUnsupportedError:
+                logger.debug("n8n does not support PATCH on workflows, using GET+PUT")
+                self._patch_supported = False
+            except N8NNotFoundError:
+                # Either the workflow or the PATCH route is missing; the GET
+                # below tells them apart
+                if self._patch_supported:
+                    raise
+
+        # A cached copy may miss recent editor changes, which the PUT would
+        # then overwrite
+        current = await self._fetch_current_workflow(workflow_id)
+        # The workflow exists, so a 404 above came from the PATCH route
+        self._patch_supported = False
+
+        payload = {
+            field: current.get(field, default)
+            for field, default in _WORKFLOW_UPDATE_DEFAULTS.items()
+        }
+        payload.update(partial_data)
+        return await self.update_workflow(workflow_id, payload)
+
+    async def _fetch_current_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Fetch a workflow straight from n8n for a read-modify-write.
+
+        Skips the workflow cache and any in-flight GET, so the PUT that
+        follows starts from the latest saved version.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Workflow object
+
+        Raises:
+            N8NNotFoundError: If workflow doesn't exist
+            N8NError: On other API errors
+        """
+        workflow: Dict[str, Any] = await self._send("GET", f"/workflows/{workflow_id}")
         return workflow
 
     async def delete_workflow(self, workflow_id: str) -> bool:
@@ -314,9 +880,52 @@ class N8NClient:
             N8NError: On other API errors
         """
         await self._request("DELETE", f"/workflows/{workflow_id}")
-        logger.info(f"Deleted workflow: {workflow_id}")
+        self.invalidate_workflow_cache(workflow_id)
+        logger.info("Deleted workflow: %s", workflow_id)
         return True
 
+    async def _set_workflow_active(
+        self,
+        workflow_id: str,
+        active: bool
+    ) -> Dict[str, Any]:
+        """Activate or deactivate a workflow.
+
+        Uses n8n's dedicated activate/deactivate endpoint, which needs a
+        single request and no body. Older n8n versions without that endpoint
+        fall back to fetching the workflow and writing it back with PUT.
+
+        Args:
+            workflow_id: Workflow ID to update
+            active: Desired active status
+
+        Returns:
+            Updated workflow object
+
+        Raises:
+            N8NNotFoundError: If workflow doesn't exist
+            N8NError: On other API errors
+        """
+        action = "activate" if active else "deactivate"
+        try:
+            updated: Dict[str, Any] = await self._request(
+                "POST", f"/workflows/{workflow_id}/{action}"
+            )
+            self.invalidate_workflow_cache(workflow_id)
+            return updated
+        except N8NNotFoundError:
+            logger.debug("No /%s endpoint for workflow %s, using GET+PUT", action, workflow_id)
+
+        workflow = await self._fetch_current_workflow(workflow_id)
+
+        # Server-managed fields are rejected or ignored by PUT
+        payload = {
+            key: value for key, value in workflow.items()
+            if key not in _READ_ONLY_WORKFLOW_FIELDS
+        }
+        payload["active"] = active
+        return await self.update_workflow(workflow_id, payload)
+
     async def activate_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Activate a workflow.
 
@@ -330,14 +939,8 @@ class N8NClient:
             N8NNotFoundError: If workflow doesn't exist
             N8NError: On other API errors
         """
-        # Get current workflow
-        workflow = await self.get_workflow(workflow_id)
-
-        # Update active status
-        workflow["active"] = True
-        updated = await self.update_workflow(workflow_id, workflow)
-
-        logger.info(f"Activated workflow: {workflow_id}")
+        updated = await self._set_workflow_active(workflow_id, True)
+        logger.info("Activated workflow: %s", workflow_id)
         return updated
 
     async def deactivate_workflow(self, workflow_id: str) -> Dict[str, Any]:
@@ -353,14 +956,8 @@ class N8NClient:
             N8NNotFoundError: If workflow doesn't exist
             N8NError: On other API errors
         """
-        # Get current workflow
-        workflow = await self.get_workflow(workflow_id)
-
-        # Update active status
-        workflow["active"] = False
-        updated = await self.update_workflow(workflow_id, workflow)
-
-        logger.info(f"Deactivated workflow: {workflow_id}")
+        updated = await self._set_workflow_active(workflow_id, False)
+        logger.info("Deactivated workflow: %s", workflow_id)
         return updated
 
     # ==================== Execution Management ====================
@@ -387,14 +984,14 @@ class N8NClient:
         if data:
             payload["data"] = data
 
-        execution = await self._request(
+        execution: Dict[str, Any] = await self._request(
             "POST",
             f"/workflows/{workflow_id}/execute",
             json=payload
         )
 
         logger.info(
-            f"Executed workflow: {workflow_id}",
+            "Executed workflow: %s", workflow_id,
             extra={"execution_id": execution.get("id")}
         )
         return execution
@@ -429,6 +1026,7 @@ class N8NClient:
         response = await self._request("GET", "/executions", params=params)
 
         # Handle different response formats
+        executions: List[Dict[str, Any]]
         if isinstance(response, dict) and "data" in response:
             executions = response["data"]
         elif isinstance(response, list):
@@ -436,9 +1034,89 @@ class N8NClient:
         else:
             executions = []
 
-        logger.info(f"Retrieved {len(executions)} executions")
+        logger.info("Retrieved %d executions", len(executions))
         return executions
 
+    async def iter_executions(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        include_data: bool = False,
+        page_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over executions one page at a time.
+
+        Args:
+            workflow_id: Optional workflow ID to filter by
+            status: Filter by status (success, error, waiting)
+            limit: Stop after this many executions (None for all)
+            include_data: Ask n8n to include the full execution data
+            page_size: Number of executions requested per page
+
+        Yields:
+            Execution objects
+
+        Raises:
+            N8NError: On API errors
+        """
+        # Execution data can be huge, so only have n8n serialize it on request
+        params: Dict[str, Any] = {"includeData": str(include_data).lower()}
+
+        if workflow_id:
+            params["workflowId"] = workflow_id
+
+        if status:
+            params["status"] = status
+
+        if limit is not None:
+            if limit <= 0:
+                return
+            page_size = min(page_size, limit)
+
+        count = 0
+        async for execution in self._paginate("/executions", params, page_size):
+            yield execution
+            count += 1
+            if limit is not None and count >= limit:
+                break
+
+    async def get_execution_count(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """Count executions matching the given filters.
+
+        The n8n API returns no totals, so this pages through the matching
+        executions with the filters applied server-side and counts them
+        without keeping any page around.
+
+        Args:
+            workflow_id: Optional workflow ID to filter by
+            status: Filter by status (success, error, waiting)
+
+        Returns:
+            Number of matching executions
+
+        Raises:
+            N8NError: On API errors
+        """
+        params: Dict[str, Any] = {}
+
+        if workflow_id:
+            params["workflowId"] = workflow_id
+
+        if status:
+            params["status"] = status
+
+        count = 0
+        async for _ in self._paginate("/executions", params, page_size=250):
+            count += 1
+
+        logger.info("Counted %d executions", count)
+        return count
+
     async def get_execution(self, execution_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific execution.
 
@@ -452,10 +1130,79 @@ class N8NClient:
             N8NNotFoundError: If execution doesn't exist
             N8NError: On other API errors
         """
-        execution = await self._request("GET", f"/executions/{execution_id}")
-        logger.info(f"Retrieved execution: {execution_id}")
+        if self.config.n8n_execution_batch_window_ms > 0:
+            execution = await self._load_execution(execution_id)
+        else:
+            execution = await self._request("GET", f"/executions/{execution_id}")
+        logger.info("Retrieved execution: %s", execution_id)
         return execution
 
+    async def _load_execution(self, execution_id: str) -> Dict[str, Any]:
+        """Queue an execution lookup for the next batch and wait for it.
+
+        Lookups arriving within ``N8N_EXECUTION_BATCH_WINDOW_MS`` are
+        dispatched together (sooner once ``N8N_EXECUTION_MAX_BATCH`` is
+        reached), so a burst of drill-down requests becomes one concurrent
+        round of requests with duplicate IDs collapsed.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Execution object with full details
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Dict[str, Any]] = loop.create_future()
+        self._execution_queue.append((execution_id, future))
+
+        if len(self._execution_queue) >= self.config.n8n_execution_max_batch:
+            self._dispatch_execution_batch()
+        elif self._execution_flush is None:
+            self._execution_flush = loop.call_later(
+                self.config.n8n_execution_batch_window_ms / 1000,
+                self._dispatch_execution_batch
+            )
+
+        return await future
+
+    def _dispatch_execution_batch(self) -> None:
+        """Start fetching every queued execution lookup."""
+        if self._execution_flush is not None:
+            self._execution_flush.cancel()
+            self._execution_flush = None
+
+        batch, self._execution_queue = self._execution_queue, []
+        if batch:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = asyncio.ensure_future(self._fetch_execution_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _fetch_execution_batch(
+        self,
+        batch: List[Tuple[str, asyncio.Future[Any]]]
+    ) -> None:
+        """Fetch a batch of executions and resolve their waiters.
+
+        Args:
+            batch: Queued (execution ID, future) pairs
+        """
+        # n8n has no multi-ID lookup, so fetch concurrently; repeated IDs
+        # share one request through the in-flight deduplication in _request
+        results = await asyncio.gather(
+            *(self._request("GET", f"/executions/{execution_id}") for execution_id, _ in batch),
+            return_exceptions=True
+        )
+
+        for (_, future), result in zip(batch, results):
+            # Skip waiters that were cancelled while the batch was in flight
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
     async def delete_execution(self, execution_id: str) -> bool:
         """Delete an execution.
 
@@ -470,7 +1217,7 @@ class N8NClient:
             N8NError: On other API errors
         """
         await self._request("DELETE", f"/executions/{execution_id}")
-        logger.info(f"Deleted execution: {execution_id}")
+        logger.info("Deleted execution: %s", execution_id)
         return True
 
     # ==================== Search & Analytics ====================
@@ -478,13 +1225,19 @@ class N8NClient:
     async def search_workflows(
         self,
         query: str,
-        active: Optional[bool] = None
+        active: Optional[bool] = None,
+        max_results: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search workflows by name or tags.
 
+        Without ``max_results`` the (cached) full workflow list is filtered.
+        With it, workflows are streamed page by page and fetching stops as
+        soon as enough matches are found.
+
         Args:
             query: Search query string
             active: Filter by active status
+            max_results: Stop after this many matches
 
         Returns:
             List of matching workflows
@@ -492,19 +1245,29 @@ class N8NClient:
         Raises:
             N8NError: On API errors
         """
-        # Get all workflows (n8n API doesn't have built-in search)
-        all_workflows = await self.list_workflows(active=active)
-
-        # Filter by query
         query_lower = query.lower()
-        matching_workflows = [
-            w for w in all_workflows
-            if query_lower in w.get("name", "").lower()
-            or any(query_lower in tag.lower() for tag in w.get("tags", []))
-        ]
+
+        def matches(workflow: Dict[str, Any]) -> bool:
+            return (
+                query_lower in workflow.get("name", "").lower()
+                or any(query_lower in tag.lower() for tag in workflow.get("tags", []))
+            )
+
+        # n8n API doesn't have built-in search, so filter client-side
+        if max_results is None:
+            all_workflows = await self.list_workflows(active=active)
+            matching_workflows = [w for w in all_workflows if matches(w)]
+        else:
+            matching_workflows = []
+            if max_results > 0:
+                async for workflow in self.iter_workflows(active=active):
+                    if matches(workflow):
+                        matching_workflows.append(workflow)
+                        if len(matching_workflows) >= max_results:
+                            break
 
         logger.info(
-            f"Search found {len(matching_workflows)} workflows",
+            "Search found %d workflows", len(matching_workflows),
             extra={"query": query}
         )
         return matching_workflows
@@ -526,9 +1289,23 @@ class N8NClient:
         Raises:
             N8NError: On API errors
         """
-        executions = await self.get_executions(workflow_id=workflow_id, limit=limit)
+        # Tally all counters in a single pass while streaming pages, so only
+        # one page of executions (without their data) is held at a time
+        total = success_count = error_count = waiting_count = 0
+        async for execution in self.iter_executions(
+            workflow_id=workflow_id,
+            limit=limit,
+            page_size=250
+        ):
+            total += 1
+            finished = execution.get("finished")
+            if execution.get("stoppedAt"):
+                error_count += 1
+            elif finished:
+                success_count += 1
+            if not finished:
+                waiting_count += 1
 
-        total = len(executions)
         if total == 0:
             return {
                 "workflow_id": workflow_id,
@@ -540,10 +1317,6 @@ class N8NClient:
                 "error_rate": 0.0
             }
 
-        success_count = sum(1 for e in executions if e.get("finished") and not e.get("stoppedAt"))
-        error_count = sum(1 for e in executions if e.get("stoppedAt"))
-        waiting_count = sum(1 for e in executions if not e.get("finished"))
-
         return {
             "workflow_id": workflow_id,
             "total_executions": total,
@@ -554,3 +1327,70 @@ class N8NClient:
             "error_rate": round((error_count / total) * 100, 2) if total > 0 else 0.0,
             "analyzed_executions": limit
         }
+
+    async def bulk_workflow_statistics(
+        self,
+        workflow_ids: Iterable[str],
+        limit: int = 100
+    ) -> Dict[str, Dict[str, Any] | BaseException]:
+        """Get execution statistics for several workflows concurrently.
+
+        Requests run in parallel, bounded by ``N8N_MAX_CONCURRENCY``. A
+        failure for one workflow does not affect the others.
+
+        Args:
+            workflow_ids: Workflow IDs to analyze
+            limit: Number of recent executions to analyze per workflow
+
+        Returns:
+            Mapping of workflow ID to its statistics, or to the exception
+            raised while fetching them
+        """
+        workflow_ids = list(workflow_ids)
+        semaphore = asyncio.Semaphore(self.config.n8n_max_concurrency)
+
+        async def _one(workflow_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_workflow_statistics(workflow_id, limit=limit)
+
+        results = await asyncio.gather(
+            *(_one(workflow_id) for workflow_id in workflow_ids),
+            return_exceptions=True
+        )
+        return dict(zip(workflow_ids, results))
+
+
+# Shared clients keyed by id(config), see get_client
+_clients: Dict[int, N8NClient] = {}
+
+
+def get_client(config: Optional[Config] = None) -> N8NClient:
+    """Get or create the shared n8n client for a configuration.
+
+    Every component (MCP tools, management API) should use this instead of
+    constructing ``N8NClient`` itself, so that the whole process shares one
+    connection pool rather than paying new TCP/TLS handshakes.
+
+    Args:
+        config: Configuration to build the client from (defaults to the
+            global configuration)
+
+    Returns:
+        N8NClient: Shared client instance
+    """
+    if config is None:
+        config = get_config()
+
+    client = _clients.get(id(config))
+    if client is None or client.config is not config:
+        client = N8NClient(config)
+        _clients[id(config)] = client
+    return client
+
+
+async def aclose_all() -> None:
+    """Close and forget every shared client created by get_client."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
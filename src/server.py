@@ -10,32 +10,56 @@ import asyncio
 import logging
 import signal
 import sys
-import os
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
+import orjson
+import uvicorn
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-import uvicorn
+
+try:
+    # Installed with uvicorn[standard] everywhere except Windows
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from aiohttp import web
 
 from src.config import get_config
-from src.n8n_client import N8NClient
-from src.management_api import management_app
+from src.management_api import management_app, probe_n8n
+from src.n8n_client import N8NClient, aclose_all, get_client
 from src.tools import (
-    ListWorkflowsTool,
-    GetWorkflowDetailsTool,
-    CreateWorkflowTool,
-    UpdateWorkflowTool,
     ActivateWorkflowTool,
+    BaseTool,
+    CreateWorkflowTool,
     DeactivateWorkflowTool,
     DeleteWorkflowTool,
-    SearchWorkflowsTool,
     ExecuteWorkflowTool,
     GetExecutionsTool,
+    GetWorkflowDetailsTool,
     GetWorkflowHealthTool,
+    ListWorkflowsTool,
+    SearchWorkflowsTool,
+    UpdateWorkflowTool,
 )
 
 logger = logging.getLogger(__name__)
 
+# Fields of a tool's data dict that hold its record list; with ?stream=1 these
+# are written one record per NDJSON line instead of inside one JSON document
+_STREAMABLE_FIELDS = ("workflows", "executions")
+
+# orjson options for every tool result the server serializes; n8n data may
+# use non-string keys (e.g. int-keyed counts), which orjson rejects by default
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Most tool calls accepted in one POST /call/batch request
+_MAX_BATCH_CALLS = 50
+
+# Entry point of a tool: arguments in, formatted success/error result out
+ToolRunner = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
 
 def setup_logging(log_level: str, log_format: str) -> None:
     """Configure logging for the application.
@@ -69,7 +93,12 @@ class MonolietMCPServer:
         self.config = get_config()
         self.n8n_client: Optional[N8NClient] = None
         self.mcp_server = Server("monoliet-n8n-mcp")
-        self.tools: List[Any] = []
+        self.tools: List[BaseTool] = []
+        # Tool name -> bound BaseTool.run, see _register_tools
+        self._dispatch: Dict[str, ToolRunner] = {}
+        self._tools_metadata: List[Dict[str, Any]] = []
+        # Queues of connected SSE clients; putting None closes the stream
+        self._sse_queues: Set[asyncio.Queue[Optional[bytes]]] = set()
         self._shutdown_event = asyncio.Event()
 
         logger.info("Monoliet MCP Server initialized")
@@ -81,10 +110,11 @@ class MonolietMCPServer:
         # Setup logging
         setup_logging(self.config.log_level, self.config.log_format)
 
-        # Initialize n8n client
-        self.n8n_client = N8NClient(self.config)
+        # Shared n8n client, also used by the Management API
+        self.n8n_client = get_client(self.config)
 
-        # Validate n8n connection
+        # Validate n8n connection; this also opens the first pooled
+        # connection so the first tool call does not pay the handshake
         try:
             health = await self.n8n_client.health_check()
             logger.info(f"n8n connection validated: {health['message']}")
@@ -119,19 +149,24 @@ class MonolietMCPServer:
 
         self.tools = [tool_class(self.n8n_client) for tool_class in tool_classes]
 
+        # Tools are fixed after registration, so build the name -> run dispatch table and their
+        # metadata once instead of on every request
+        self._dispatch = {tool.name: tool.run for tool in self.tools}
+        self._tools_metadata = [tool.get_tool_metadata() for tool in self.tools]
+
         # Register tools with MCP server
         @self.mcp_server.list_tools()
         async def list_tools() -> List[Dict[str, Any]]:
             """List all available tools."""
-            return [tool.get_tool_metadata() for tool in self.tools]
+            return self._tools_metadata
 
         @self.mcp_server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Any]:
             """Call a tool by name with arguments."""
             # Find the tool
-            tool = next((t for t in self.tools if t.name == name), None)
+            run_tool = self._dispatch.get(name)
 
-            if not tool:
+            if not run_tool:
                 error_msg = f"Unknown tool: {name}"
                 logger.error(error_msg)
                 return [{
@@ -141,7 +176,7 @@ class MonolietMCPServer:
 
             # Execute the tool
             try:
-                result = await tool.run(arguments)
+                result = await run_tool(arguments)
 
                 # Format response for MCP
                 if result.get("success"):
@@ -175,9 +210,8 @@ class MonolietMCPServer:
         Returns:
             Formatted text response
         """
-        import json
         data = result.get("data", {})
-        return json.dumps(data, indent=2)
+        return orjson.dumps(data, option=_JSON_OPTIONS | orjson.OPT_INDENT_2).decode()
 
     def _format_error_response(self, result: Dict[str, Any]) -> str:
         """Format error tool response as text.
@@ -204,11 +238,72 @@ class MonolietMCPServer:
                 self.mcp_server.create_initialization_options()
             )
 
-    async def run_http(self) -> None:
-        """Run the MCP server in HTTP mode (for remote access)."""
+    def build_http_app(self) -> "web.Application":
+        """Build the aiohttp application serving the HTTP endpoints.
+
+        Tools must be registered first, see initialize.
+
+        Returns:
+            Application with the MCP HTTP routes
+        """
         from aiohttp import web
 
-        logger.info(f"Running MCP server in HTTP mode on {self.config.mcp_server_host}:{self.config.mcp_server_port}...")
+        def json_response(data: Any, status: int = 200) -> web.Response:
+            """Build a JSON response serialized with orjson."""
+            return web.Response(
+                body=orjson.dumps(data, option=_JSON_OPTIONS),
+                status=status,
+                content_type='application/json'
+            )
+
+        async def stream_response(
+            request: web.Request,
+            result: Dict[str, Any]
+        ) -> Optional[web.StreamResponse]:
+            """Write a tool result as NDJSON, one record per line.
+
+            The first line is the result envelope without its record list;
+            each following line is one record. A record that cannot be
+            serialized ends the stream with an ``{"error": ...}`` line.
+            Results without a record list return None so the caller falls
+            back to a buffered response.
+            """
+            data = result.get('data')
+            if isinstance(data, list):
+                header = {**result, 'data': None}
+                records = data
+            elif isinstance(data, dict):
+                field = next(
+                    (f for f in _STREAMABLE_FIELDS if isinstance(data.get(f), list)),
+                    None
+                )
+                if field is None:
+                    return None
+                records = data[field]
+                header = {
+                    **result,
+                    'data': {k: v for k, v in data.items() if k != field},
+                    'stream': field
+                }
+            else:
+                return None
+
+            response = web.StreamResponse()
+            response.content_type = 'application/x-ndjson'
+            response.enable_chunked_encoding()
+            await response.prepare(request)
+
+            await response.write(orjson.dumps(header, option=_JSON_OPTIONS) + b'\n')
+            try:
+                for record in records:
+                    await response.write(orjson.dumps(record, option=_JSON_OPTIONS) + b'\n')
+            except orjson.JSONEncodeError as e:
+                # The status line is already sent, so report the failure as
+                # the stream's last record
+                logger.exception("Error streaming tool result")
+                await response.write(orjson.dumps({'error': str(e)}) + b'\n')
+            await response.write_eof()
+            return response
 
         async def handle_sse(request: web.Request) -> web.StreamResponse:
             """Handle Server-Sent Events connection."""
@@ -219,91 +314,201 @@ class MonolietMCPServer:
             response.headers['Access-Control-Allow-Origin'] = '*'
             await response.prepare(request)
 
+            queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+            self._sse_queues.add(queue)
+            interval = self.config.sse_keepalive_interval
+            next_message: Optional[asyncio.Future[Optional[bytes]]] = None
+
             try:
-                # Keep connection alive and handle MCP protocol
+                # Wake up only for a queued message or after an idle interval
                 while True:
-                    await asyncio.sleep(1)
-                    await response.write(b': keepalive\n\n')
+                    if next_message is None:
+                        next_message = asyncio.ensure_future(queue.get())
+                    done, _ = await asyncio.wait({next_message}, timeout=interval)
+
+                    if not done:
+                        await response.write(b': keepalive\n\n')
+                        continue
+
+                    message = next_message.result()
+                    next_message = None
+                    if message is None:
+                        break
+                    await response.write(message)
+            except ConnectionResetError:
+                logger.debug("SSE client disconnected")
             except Exception as e:
                 logger.error(f"SSE error: {e}")
             finally:
-                await response.write_eof()
+                if next_message is not None:
+                    next_message.cancel()
+                self._sse_queues.discard(queue)
+                try:
+                    await response.write_eof()
+                except ConnectionResetError:
+                    pass
 
             return response
 
-        async def handle_post(request: web.Request) -> web.Response:
-            """Handle MCP tool calls via POST."""
-            try:
-                data = await request.json()
+        async def run_call(data: Any) -> Tuple[int, Dict[str, Any]]:
+            """Validate and run one tool call.
+
+            Args:
+                data: Decoded call object with "tool" and "arguments"
+
+            Returns:
+                Tuple of (HTTP status, response body)
+            """
+            if not isinstance(data, dict):
+                return 400, {'error': 'Request body must be a JSON object'}
 
-                tool_name = data.get('tool')
-                arguments = data.get('arguments', {})
+            tool_name = data.get('tool')
+            arguments = data.get('arguments', {})
 
-                if not tool_name:
-                    return web.json_response(
-                        {'error': 'Missing tool name'},
+            if not tool_name:
+                return 400, {'error': 'Missing tool name'}
+
+            # Find and execute tool
+            run_tool = self._dispatch.get(tool_name)
+
+            if not run_tool:
+                return 404, {'error': f'Unknown tool: {tool_name}'}
+
+            return 200, await run_tool(arguments)
+
+        async def handle_post(request: web.Request) -> web.StreamResponse:
+            """Handle MCP tool calls via POST."""
+            try:
+                # Parse the buffered body directly; the size is bounded by
+                # the application's client_max_size
+                try:
+                    data = orjson.loads(await request.read())
+                except orjson.JSONDecodeError:
+                    return json_response(
+                        {'error': 'Invalid JSON body'},
                         status=400
                     )
 
-                # Find and execute tool
-                tool = next((t for t in self.tools if t.name == tool_name), None)
+                status, result = await run_call(data)
 
-                if not tool:
-                    return web.json_response(
-                        {'error': f'Unknown tool: {tool_name}'},
-                        status=404
-                    )
+                if status == 200 and request.query.get('stream') in ('1', 'true'):
+                    streamed = await stream_response(request, result)
+                    if streamed is not None:
+                        return streamed
 
-                result = await tool.run(arguments)
-                return web.json_response(result)
+                return json_response(result, status=status)
 
             except Exception as e:
                 logger.exception(f"Error handling POST request: {e}")
-                return web.json_response(
+                return json_response(
                     {'error': str(e)},
                     status=500
                 )
 
-        async def handle_list_tools(request: web.Request) -> web.Response:
-            """Handle listing available tools."""
+        async def run_batch_call(data: Any) -> Dict[str, Any]:
+            """Run one call of a batch, reporting failures in its entry."""
             try:
-                tools_metadata = [tool.get_tool_metadata() for tool in self.tools]
-                return web.json_response({
-                    'tools': tools_metadata,
-                    'count': len(tools_metadata)
-                })
+                status, result = await run_call(data)
             except Exception as e:
-                logger.exception(f"Error listing tools: {e}")
-                return web.json_response(
-                    {'error': str(e)},
-                    status=500
+                logger.exception("Error handling batched call")
+                status, result = 500, {'error': str(e)}
+            if status != 200:
+                result = {**result, 'status': status}
+            return result
+
+        async def handle_batch(request: web.Request) -> web.Response:
+            """Handle several MCP tool calls in one POST."""
+            try:
+                data = orjson.loads(await request.read())
+            except orjson.JSONDecodeError:
+                return json_response({'error': 'Invalid JSON body'}, status=400)
+            if not isinstance(data, list):
+                return json_response(
+                    {'error': 'Request body must be a JSON array of calls'},
+                    status=400
+                )
+            if len(data) > _MAX_BATCH_CALLS:
+                return json_response(
+                    {'error': f'At most {_MAX_BATCH_CALLS} calls per batch'},
+                    status=400
                 )
 
+            # Calls are independent, so run them concurrently; results keep
+            # the request order
+            results = await asyncio.gather(*(run_batch_call(call) for call in data))
+            return json_response({'results': results, 'count': len(results)})
+
+        # The tool list never changes while serving, so serialize it once,
+        # embedding each schema as the bytes precomputed on its tool class
+        tools_body = orjson.dumps({
+            'tools': [
+                {**metadata, 'inputSchema': orjson.Fragment(tool.input_schema_json)}
+                for tool, metadata in zip(self.tools, self._tools_metadata)
+            ],
+            'count': len(self._tools_metadata)
+        })
+
+        async def handle_list_tools(request: web.Request) -> web.Response:
+            """Handle listing available tools."""
+            return web.Response(body=tools_body, content_type='application/json')
+
         async def handle_health(request: web.Request) -> web.Response:
             """Health check endpoint."""
-            try:
-                # Check n8n connection
-                health = await self.n8n_client.health_check()
-                return web.json_response({
-                    'status': 'healthy',
-                    'n8n': health,
-                    'tools_count': len(self.tools)
-                })
-            except Exception as e:
-                return web.json_response({
+            client = self.n8n_client
+            if client is None:
+                return json_response({
                     'status': 'unhealthy',
-                    'error': str(e)
+                    'error': 'n8n client not initialized'
                 }, status=503)
 
-        # Create aiohttp application
-        app = web.Application()
+            # Shares the TTL-cached, single-flight probe with the Management
+            # API so frequent polling does not hit n8n on every request
+            error = await probe_n8n(client)
+            if error is not None:
+                return json_response({
+                    'status': 'unhealthy',
+                    'error': error
+                }, status=503)
+
+            return json_response({
+                'status': 'healthy',
+                'n8n': {
+                    'status': 'healthy',
+                    'url': client.base_url,
+                    'message': 'Successfully connected to n8n'
+                },
+                'tools_count': len(self.tools)
+            })
+
+        # Create aiohttp application; bound request bodies (e.g. large
+        # workflow definitions) so a single request cannot exhaust memory
+        app = web.Application(client_max_size=self.config.mcp_client_max_size)
         app.router.add_get('/sse', handle_sse)
         app.router.add_post('/call', handle_post)
+        app.router.add_post('/call/batch', handle_batch)
         app.router.add_get('/tools', handle_list_tools)
         app.router.add_get('/health', handle_health)
+        return app
 
-        # Run HTTP server
-        runner = web.AppRunner(app)
+    async def run_http(self) -> None:
+        """Run the MCP server in HTTP mode (for remote access)."""
+        from aiohttp import web
+
+        logger.info(f"Running MCP server in HTTP mode on {self.config.mcp_server_host}:{self.config.mcp_server_port}...")
+
+        app = self.build_http_app()
+
+        # Run HTTP server; keep idle client connections open long enough for
+        # polling MCP clients to reuse them
+        runner_kwargs: Dict[str, Any] = {}
+        if not self.config.enable_access_log:
+            # Skip per-request access log formatting on hot endpoints
+            runner_kwargs["access_log"] = None
+        runner = web.AppRunner(
+            app,
+            keepalive_timeout=self.config.mcp_http_keepalive_timeout,
+            **runner_kwargs
+        )
         await runner.setup()
         site = web.TCPSite(
             runner,
@@ -315,12 +520,17 @@ class MonolietMCPServer:
         logger.info(f"HTTP server started on http://{self.config.mcp_server_host}:{self.config.mcp_server_port}")
         logger.info("Endpoints:")
         logger.info(f"  - POST http://{self.config.mcp_server_host}:{self.config.mcp_server_port}/call - Execute tools")
+        logger.info(f"  - POST http://{self.config.mcp_server_host}:{self.config.mcp_server_port}/call/batch - Execute several tools")
         logger.info(f"  - GET  http://{self.config.mcp_server_host}:{self.config.mcp_server_port}/tools - List tools")
         logger.info(f"  - GET  http://{self.config.mcp_server_host}:{self.config.mcp_server_port}/health - Health check")
         logger.info(f"  - GET  http://{self.config.mcp_server_host}:{self.config.mcp_server_port}/sse - SSE connection")
 
         # Wait for shutdown signal
         await self._shutdown_event.wait()
+
+        # Let open SSE streams finish instead of holding up cleanup
+        for queue in self._sse_queues:
+            queue.put_nowait(None)
         await runner.cleanup()
 
     async def run_management_api(self) -> None:
@@ -328,18 +538,36 @@ class MonolietMCPServer:
         config = self.config
         logger.info(f"Starting Management API on port {config.management_api_port}...")
 
+        # Runs on this process's event loop; log_config=None keeps the
+        # logging set up by setup_logging instead of uvicorn's own
         uvicorn_config = uvicorn.Config(
             management_app,
             host="0.0.0.0",
             port=config.management_api_port,
-            log_level=config.log_level.lower()
+            log_level=config.log_level.lower(),
+            log_config=None,
+            access_log=config.enable_access_log
         )
 
         server = uvicorn.Server(uvicorn_config)
-        await server.serve()
 
-    async def run(self) -> None:
-        """Run the MCP server."""
+        async def stop_on_shutdown() -> None:
+            """Stop uvicorn when the MCP server shuts down."""
+            await self._shutdown_event.wait()
+            server.should_exit = True
+
+        watcher = asyncio.create_task(stop_on_shutdown())
+        try:
+            await server.serve()
+        finally:
+            watcher.cancel()
+
+    async def run(self, mode: Optional[str] = None) -> None:
+        """Run the MCP server.
+
+        Args:
+            mode: MCP transport, 'stdio' or 'http' (defaults to MCP_SERVER_MODE)
+        """
         logger.info("Starting Monoliet MCP Server with Management API...")
 
         try:
@@ -347,7 +575,7 @@ class MonolietMCPServer:
             await self.initialize()
 
             # Setup signal handlers for graceful shutdown
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             def signal_handler(signum: int) -> None:
                 logger.info(f"Received signal {signum}, initiating shutdown...")
@@ -356,8 +584,8 @@ class MonolietMCPServer:
             for sig in (signal.SIGTERM, signal.SIGINT):
                 loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
 
-            # Determine server mode from environment or config
-            server_mode = os.environ.get('MCP_SERVER_MODE', 'stdio').lower()
+            # Explicit mode wins over MCP_SERVER_MODE
+            server_mode = (mode or self.config.mcp_server_mode).lower()
 
             logger.info(f"MCP server mode: {server_mode}")
             logger.info(f"Management API port: {self.config.management_api_port}")
@@ -365,10 +593,11 @@ class MonolietMCPServer:
             if server_mode == 'http':
                 # Run both MCP HTTP server and Management API concurrently
                 logger.info("Running in HTTP mode - both MCP and Management API servers")
-                await asyncio.gather(
-                    self.run_http(),
-                    self.run_management_api()
-                )
+                # Both servers stop on the shutdown event; if either fails the
+                # TaskGroup cancels the other instead of leaving it running
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self.run_http())
+                    tg.create_task(self.run_management_api())
             else:
                 # Run stdio mode for MCP, but still run Management API for Django portal
                 logger.info("Running in STDIO mode for MCP, HTTP mode for Management API")
@@ -403,15 +632,18 @@ class MonolietMCPServer:
         """Gracefully shutdown the server."""
         logger.info("Shutting down server...")
 
-        # Close n8n client
-        if self.n8n_client:
-            await self.n8n_client.close()
+        # Close shared n8n clients
+        await aclose_all()
 
         logger.info("Server shutdown complete")
 
 
 def main() -> None:
     """Main entry point for the MCP server."""
+    # libuv-based loop speeds up aiohttp and uvicorn socket handling
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Create and run server
     server = MonolietMCPServer()
 
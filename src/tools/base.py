@@ -1,9 +1,11 @@
 """Base class for MCP tools."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, Optional
 from abc import ABC, abstractmethod
 
+import orjson
+
 from src.n8n_client import N8NClient, N8NError
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,7 @@ class BaseTool(ABC):
         name: Tool name used in MCP protocol
         description: Tool description for LLM
         input_schema: JSON schema for tool parameters
+        input_schema_json: input_schema serialized once at class creation
         n8n_client: n8n API client instance
     """
 
@@ -29,6 +32,20 @@ class BaseTool(ABC):
         "properties": {},
         "required": []
     }
+    input_schema_json: bytes = orjson.dumps(input_schema)
+    _required: FrozenSet[str] = frozenset()
+    _int_bounds: ClassVar[Dict[str, range]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the serialized schema and argument checks."""
+        super().__init_subclass__(**kwargs)
+        cls.input_schema_json = orjson.dumps(cls.input_schema)
+        cls._required = frozenset(cls.input_schema.get("required", []))
+        cls._int_bounds = {
+            name: range(spec["minimum"], spec["maximum"] + 1)
+            for name, spec in cls.input_schema.get("properties", {}).items()
+            if spec.get("type") == "integer" and "minimum" in spec and "maximum" in spec
+        }
 
     def __init__(self, n8n_client: N8NClient) -> None:
         """Initialize the tool.
@@ -69,17 +86,24 @@ class BaseTool(ABC):
             Formatted tool response with success/error information
         """
         try:
-            logger.info(
-                f"Executing tool: {self.name}",
-                extra={"tool": self.name, "arguments": arguments}
-            )
-
+            # Arguments can hold whole workflow definitions, so only attach
+            # them to the record when DEBUG logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Executing tool: %s", self.name,
+                    extra={"tool": self.name, "arguments": arguments}
+                )
+            elif logger.isEnabledFor(logging.INFO):
+                logger.info("Executing tool: %s", self.name, extra={"tool": self.name})
+
+            self._validate_bounds(arguments)
             result = await self.execute(arguments)
 
-            logger.info(
-                f"Tool execution successful: {self.name}",
-                extra={"tool": self.name}
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Tool execution successful: %s", self.name,
+                    extra={"tool": self.name}
+                )
 
             return self._format_success(result)
 
@@ -148,20 +172,37 @@ class BaseTool(ABC):
     def _validate_required_args(
         self,
         arguments: Dict[str, Any],
-        required: list[str]
+        required: Optional[Iterable[str]] = None
     ) -> None:
         """Validate that required arguments are present.
 
         Args:
             arguments: Tool arguments
-            required: List of required argument names
+            required: Required argument names (defaults to the names
+                listed as required in the tool's input schema)
 
         Raises:
             ValueError: If required arguments are missing
         """
-        missing = [arg for arg in required if arg not in arguments]
+        required_args = self._required if required is None else frozenset(required)
+        missing = required_args - arguments.keys()
         if missing:
-            raise ValueError(f"Missing required arguments: {', '.join(missing)}")
+            raise ValueError(f"Missing required arguments: {', '.join(sorted(missing))}")
+
+    def _validate_bounds(self, arguments: Dict[str, Any]) -> None:
+        """Validate integer arguments against their schema minimum/maximum.
+
+        Args:
+            arguments: Tool arguments
+
+        Raises:
+            ValueError: If an integer argument is out of bounds
+        """
+        for name, bounds in self._int_bounds.items():
+            if name in arguments and arguments[name] not in bounds:
+                raise ValueError(
+                    f"{name.capitalize()} must be between {bounds.start} and {bounds.stop - 1}"
+                )
 
     def get_tool_metadata(self) -> Dict[str, Any]:
         """Get tool metadata for MCP registration.
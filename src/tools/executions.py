@@ -1,12 +1,19 @@
 """Execution management tools for MCP server."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
+from src.n8n_client import N8NClient
 from src.tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Execution status indexed by (bool(stoppedAt) << 1) | bool(finished): a
+# stopped execution is an error, a finished one a success, anything else is
+# still running
+_STATUS = ("running", "success", "error", "error")
+
 
 class ExecuteWorkflowTool(BaseTool):
     """Manually execute an n8n workflow."""
@@ -34,7 +41,7 @@ class ExecuteWorkflowTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to trigger workflow execution."""
-        self._validate_required_args(arguments, ["workflow_id"])
+        self._validate_required_args(arguments)
 
         workflow_id = arguments["workflow_id"]
         input_data = arguments.get("data")
@@ -52,13 +59,7 @@ class ExecuteWorkflowTool(BaseTool):
         started_at = execution.get("startedAt")
         stopped_at = execution.get("stoppedAt")
 
-        # Determine execution status
-        if stopped_at:
-            status = "error"
-        elif finished:
-            status = "success"
-        else:
-            status = "running"
+        status = _STATUS[bool(stopped_at) << 1 | bool(finished)]
 
         return {
             "execution_id": execution_id,
@@ -106,65 +107,121 @@ class GetExecutionsTool(BaseTool):
                 "type": "boolean",
                 "description": "Include full execution data in response",
                 "default": False
+            },
+            "count_only": {
+                "type": "boolean",
+                "description": (
+                    "Only return the number of matching executions, "
+                    "without listing them"
+                ),
+                "default": False
             }
         }
     }
 
+    def __init__(self, n8n_client: N8NClient) -> None:
+        """Initialize the tool.
+
+        Args:
+            n8n_client: n8n API client instance
+        """
+        super().__init__(n8n_client)
+        # In-flight lookups keyed by their arguments, see execute
+        self._inflight: Dict[Hashable, asyncio.Future[Dict[str, Any]]] = {}
+
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the tool to get execution history."""
+        """Execute the tool to get execution history.
+
+        Concurrent calls with the same arguments (e.g. several dashboards
+        polling the same workflow) share one lookup and receive the same
+        result object.
+        """
         workflow_id = arguments.get("workflow_id")
         status_filter = arguments.get("status", "all")
         limit = arguments.get("limit", 20)
-        include_data = arguments.get("include_data", False)
-
-        # Validate limit
-        if limit < 1 or limit > 250:
-            raise ValueError("Limit must be between 1 and 250")
-
+        include_data = bool(arguments.get("include_data", False))
+        count_only = bool(arguments.get("count_only", False))
+
+        key = (workflow_id, status_filter, limit, include_data, count_only)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_executions(*key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(task)
+
+    async def _get_executions(
+        self,
+        workflow_id: Optional[str],
+        status_filter: str,
+        limit: int,
+        include_data: bool,
+        count_only: bool
+    ) -> Dict[str, Any]:
+        """Fetch, format and summarize executions for execute()."""
         # Determine status filter for API
         status_param: Optional[str] = None
         if status_filter != "all":
             status_param = status_filter
 
-        # Get executions from n8n
-        executions = await self.n8n_client.get_executions(
+        if count_only:
+            total = await self.n8n_client.get_execution_count(
+                workflow_id=workflow_id,
+                status=status_param
+            )
+            return {
+                "total_count": total,
+                "filters": {
+                    "workflow_id": workflow_id,
+                    "status": status_filter
+                }
+            }
+
+        # Stream executions from n8n, formatting and tallying statuses in a
+        # single pass so the raw pages are not kept alongside the result
+        formatted_executions: List[Dict[str, Any]] = []
+        append = formatted_executions.append
+        # Rows per _STATUS index, so counting needs no status string lookups
+        tally = [0, 0, 0, 0]
+        async for execution in self.n8n_client.iter_executions(
             workflow_id=workflow_id,
+            status=status_param,
             limit=limit,
-            status=status_param
-        )
+            include_data=include_data,
+            page_size=250
+        ):
+            get = execution.get
+            stopped_at = get("stoppedAt")
+            finished = get("finished", False)
+
+            index = bool(stopped_at) << 1 | bool(finished)
+            tally[index] += 1
 
-        # Format executions
-        formatted_executions = []
-        for execution in executions:
             exec_data = {
-                "id": execution.get("id"),
-                "workflow_id": execution.get("workflowId"),
-                "workflow_name": execution.get("workflowData", {}).get("name"),
-                "mode": execution.get("mode"),
-                "started_at": execution.get("startedAt"),
-                "stopped_at": execution.get("stoppedAt"),
-                "finished": execution.get("finished", False),
-                "status": self._determine_status(execution)
+                "id": get("id"),
+                "workflow_id": get("workflowId"),
+                "workflow_name": get("workflowData", {}).get("name"),
+                "mode": get("mode"),
+                "started_at": get("startedAt"),
+                "stopped_at": stopped_at,
+                "finished": finished,
+                "status": _STATUS[index]
             }
 
             # Include full data if requested
             if include_data:
-                exec_data["data"] = execution.get("data")
-                exec_data["execution_data"] = execution.get("executionData")
+                exec_data["data"] = get("data")
+                exec_data["execution_data"] = get("executionData")
 
-            formatted_executions.append(exec_data)
-
-        # Calculate summary statistics
-        total = len(formatted_executions)
-        success_count = sum(1 for e in formatted_executions if e["status"] == "success")
-        error_count = sum(1 for e in formatted_executions if e["status"] == "error")
-        running_count = sum(1 for e in formatted_executions if e["status"] == "running")
+            append(exec_data)
 
         return {
-            "total_count": total,
-            "success_count": success_count,
-            "error_count": error_count,
-            "running_count": running_count,
+            "total_count": len(formatted_executions),
+            "success_count": tally[1],
+            "error_count": tally[2] + tally[3],
+            "running_count": tally[0],
             "filters": {
                 "workflow_id": workflow_id,
                 "status": status_filter,
@@ -172,22 +229,3 @@ class GetExecutionsTool(BaseTool):
             },
             "executions": formatted_executions
         }
-
-    def _determine_status(self, execution: Dict[str, Any]) -> str:
-        """Determine execution status from execution data.
-
-        Args:
-            execution: Execution object from n8n API
-
-        Returns:
-            Status string: 'success', 'error', or 'running'
-        """
-        stopped_at = execution.get("stoppedAt")
-        finished = execution.get("finished", False)
-
-        if stopped_at:
-            return "error"
-        elif finished:
-            return "success"
-        else:
-            return "running"
@@ -1,8 +1,10 @@
 """Health and monitoring tools for MCP server."""
 
+import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+from src.n8n_client import N8NNotFoundError
 from src.tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -37,25 +39,48 @@ class GetWorkflowHealthTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to get workflow health statistics."""
-        self._validate_required_args(arguments, ["workflow_id"])
+        self._validate_required_args(arguments)
 
         workflow_id = arguments["workflow_id"]
         limit = arguments.get("limit", 100)
 
-        # Validate limit
-        if limit < 10 or limit > 1000:
-            raise ValueError("Limit must be between 10 and 1000")
+        # Workflow details and execution statistics are independent, so
+        # fetch them concurrently
+        workflow_result: Dict[str, Any] | BaseException
+        stats_result: Dict[str, Any] | BaseException
+        workflow_result, stats_result = await asyncio.gather(
+            self.n8n_client.get_workflow(workflow_id),
+            self.n8n_client.get_workflow_statistics(
+                workflow_id=workflow_id,
+                limit=limit
+            ),
+            return_exceptions=True
+        )
 
-        # Get workflow information
-        workflow = await self.n8n_client.get_workflow(workflow_id)
-        workflow_name = workflow.get("name", "Unknown")
-        is_active = workflow.get("active", False)
+        if isinstance(stats_result, BaseException):
+            raise stats_result
+        stats: Dict[str, Any] = stats_result
+
+        workflow: Dict[str, Any]
+        is_active: Optional[bool]
+        if isinstance(workflow_result, N8NNotFoundError):
+            raise workflow_result
+        if isinstance(workflow_result, BaseException):
+            # The statistics are still useful without the workflow details
+            logger.warning(
+                "Could not fetch workflow %s for health report: %s",
+                workflow_id,
+                workflow_result,
+                extra={"tool": self.name, "error": str(workflow_result)}
+            )
+            workflow = {}
+            # Unknown, so no recommendation assumes the workflow is inactive
+            is_active = None
+        else:
+            workflow = workflow_result
+            is_active = workflow.get("active", False)
 
-        # Get execution statistics
-        stats = await self.n8n_client.get_workflow_statistics(
-            workflow_id=workflow_id,
-            limit=limit
-        )
+        workflow_name = workflow.get("name", "Unknown")
 
         # Determine health status based on error rate
         error_rate = stats.get("error_rate", 0.0)
@@ -94,47 +119,73 @@ class GetWorkflowHealthTool(BaseTool):
         self,
         error_rate: float,
         total_executions: int,
-        is_active: bool
+        is_active: Optional[bool]
     ) -> list[str]:
         """Generate health recommendations based on statistics.
 
         Args:
             error_rate: Error rate percentage
             total_executions: Total number of executions
-            is_active: Whether workflow is active
+            is_active: Whether workflow is active, or None if unknown
 
         Returns:
             List of recommendation strings
         """
-        recommendations = []
-
-        if error_rate > 20:
-            recommendations.append(
-                "High error rate detected. Review workflow logs and fix failing nodes."
-            )
-        elif error_rate > 5:
-            recommendations.append(
-                "Moderate error rate. Consider investigating recent failures."
-            )
+        return list(_RECS[(_error_bucket(error_rate), total_executions == 0, is_active)])
+
+
+def _error_bucket(error_rate: float) -> int:
+    """Map an error rate to its recommendation bucket.
+
+    Args:
+        error_rate: Error rate percentage
+
+    Returns:
+        0 for no errors, 1 up to 5%, 2 up to 20%, 3 above 20%
+    """
+    if error_rate > 20:
+        return 3
+    if error_rate > 5:
+        return 2
+    return 1 if error_rate > 0 else 0
+
+
+_HIGH_ERROR_RATE = "High error rate detected. Review workflow logs and fix failing nodes."
+_MODERATE_ERROR_RATE = "Moderate error rate. Consider investigating recent failures."
+_NO_EXECUTIONS_ACTIVE = "No executions found. Verify workflow triggers are configured correctly."
+_NO_EXECUTIONS_INACTIVE = (
+    "Workflow is inactive and has no executions. Activate to start processing."
+)
+_NO_ERRORS = "Excellent! Workflow is running smoothly with no errors."
+_HEALTHY = "Workflow health is good. Continue monitoring for any issues."
+
+
+def _build_recommendations(
+    bucket: int, no_executions: bool, is_active: Optional[bool]
+) -> Tuple[str, ...]:
+    """Build the recommendations for one (bucket, no executions, active) case."""
+    recommendations: Tuple[str, ...] = ()
+
+    if bucket == 3:
+        recommendations += (_HIGH_ERROR_RATE,)
+    elif bucket == 2:
+        recommendations += (_MODERATE_ERROR_RATE,)
+
+    if no_executions:
+        # Only suggest activating when the workflow is known to be inactive
+        recommendations += (
+            _NO_EXECUTIONS_INACTIVE if is_active is False else _NO_EXECUTIONS_ACTIVE,
+        )
+    elif bucket == 0:
+        recommendations += (_NO_ERRORS,)
 
-        if total_executions == 0:
-            if is_active:
-                recommendations.append(
-                    "No executions found. Verify workflow triggers are configured correctly."
-                )
-            else:
-                recommendations.append(
-                    "Workflow is inactive and has no executions. Activate to start processing."
-                )
-
-        if total_executions > 0 and error_rate == 0:
-            recommendations.append(
-                "Excellent! Workflow is running smoothly with no errors."
-            )
+    return recommendations or (_HEALTHY,)
 
-        if not recommendations:
-            recommendations.append(
-                "Workflow health is good. Continue monitoring for any issues."
-            )
 
-        return recommendations
+# (error bucket, no executions, is active) -> recommendations, built once
+_RECS: Dict[Tuple[int, bool, Optional[bool]], Tuple[str, ...]] = {
+    (bucket, no_executions, is_active): _build_recommendations(bucket, no_executions, is_active)
+    for bucket in range(4)
+    for no_executions in (False, True)
+    for is_active in (False, True, None)
+}
@@ -1,12 +1,41 @@
 """Workflow management tools for MCP server."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.n8n_client import N8NClient
 from src.tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Search results are reused for this many seconds, see SearchWorkflowsTool
+_SEARCH_CACHE_TTL = 15.0
+_SEARCH_CACHE_SIZE = 128
+
+# Workflow fields the update tool may change
+_UPDATABLE_FIELDS = ("name", "nodes", "connections", "settings", "tags", "active")
+
+
+def _summarize_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the summary returned for a workflow in list and search results.
+
+    Args:
+        workflow: Workflow object from n8n API
+
+    Returns:
+        Workflow summary
+    """
+    get = workflow.get
+    return {
+        "id": get("id"),
+        "name": get("name"),
+        "active": get("active", False),
+        "tags": get("tags", []),
+        "created_at": get("createdAt"),
+        "updated_at": get("updatedAt")
+    }
+
 
 class ListWorkflowsTool(BaseTool):
     """List all n8n workflows with optional filtering."""
@@ -46,17 +75,7 @@ class ListWorkflowsTool(BaseTool):
         return {
             "total_count": len(workflows),
             "filter": status_filter,
-            "workflows": [
-                {
-                    "id": w.get("id"),
-                    "name": w.get("name"),
-                    "active": w.get("active", False),
-                    "tags": w.get("tags", []),
-                    "created_at": w.get("createdAt"),
-                    "updated_at": w.get("updatedAt")
-                }
-                for w in workflows
-            ]
+            "workflows": list(map(_summarize_workflow, workflows))
         }
 
 
@@ -81,7 +100,7 @@ class GetWorkflowDetailsTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to get workflow details."""
-        self._validate_required_args(arguments, ["workflow_id"])
+        self._validate_required_args(arguments)
 
         workflow_id = arguments["workflow_id"]
         workflow = await self.n8n_client.get_workflow(workflow_id)
@@ -150,7 +169,7 @@ class CreateWorkflowTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to create a workflow."""
-        self._validate_required_args(arguments, ["name"])
+        self._validate_required_args(arguments)
 
         # Build workflow data
         workflow_data = {
@@ -220,25 +239,19 @@ class UpdateWorkflowTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to update a workflow."""
-        self._validate_required_args(arguments, ["workflow_id"])
+        self._validate_required_args(arguments)
 
         workflow_id = arguments["workflow_id"]
 
-        # Get current workflow
-        current_workflow = await self.n8n_client.get_workflow(workflow_id)
-
-        # Build update data (merge with current)
-        workflow_data = {
-            "name": arguments.get("name", current_workflow.get("name")),
-            "nodes": arguments.get("nodes", current_workflow.get("nodes", [])),
-            "connections": arguments.get("connections", current_workflow.get("connections", {})),
-            "settings": arguments.get("settings", current_workflow.get("settings", {})),
-            "tags": arguments.get("tags", current_workflow.get("tags", [])),
-            "active": arguments.get("active", current_workflow.get("active", False))
+        # Send only the fields the caller changed; the client merges them
+        # with the current workflow if n8n does not accept partial updates
+        partial_data = {
+            field: arguments[field]
+            for field in _UPDATABLE_FIELDS
+            if field in arguments
         }
 
-        # Update workflow
-        workflow = await self.n8n_client.update_workflow(workflow_id, workflow_data)
+        workflow = await self.n8n_client.patch_workflow(workflow_id, partial_data)
 
         return {
             "id": workflow.get("id"),
@@ -270,7 +283,7 @@ class ActivateWorkflowTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to activate a workflow."""
-        self._validate_required_args(arguments, ["workflow_id"])
+        self._validate_required_args(arguments)
 
         workflow_id = arguments["workflow_id"]
         workflow = await self.n8n_client.activate_workflow(workflow_id)
@@ -304,7 +317,7 @@ class DeactivateWorkflowTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to deactivate a workflow."""
-        self._validate_required_args(arguments, ["workflow_id"])
+        self._validate_required_args(arguments)
 
         workflow_id = arguments["workflow_id"]
         workflow = await self.n8n_client.deactivate_workflow(workflow_id)
@@ -343,7 +356,7 @@ class DeleteWorkflowTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to delete a workflow."""
-        self._validate_required_args(arguments, ["workflow_id", "confirm"])
+        self._validate_required_args(arguments)
 
         if not arguments.get("confirm", False):
             raise ValueError(
@@ -352,13 +365,16 @@ class DeleteWorkflowTool(BaseTool):
 
         workflow_id = arguments["workflow_id"]
 
-        # Get workflow name before deletion
-        workflow = await self.n8n_client.get_workflow(workflow_id)
-        workflow_name = workflow.get("name", "Unknown")
+        # Get workflow name before deletion, from the cache when possible
+        workflow = self.n8n_client.peek_workflow(workflow_id)
+        if workflow is None:
+            workflow = await self.n8n_client.get_workflow(workflow_id)
 
         # Delete workflow
         await self.n8n_client.delete_workflow(workflow_id)
 
+        workflow_name = workflow.get("name", "Unknown")
+
         return {
             "id": workflow_id,
             "name": workflow_name,
@@ -391,30 +407,55 @@ class SearchWorkflowsTool(BaseTool):
         "required": ["query"]
     }
 
+    def __init__(self, n8n_client: N8NClient) -> None:
+        """Initialize the tool.
+
+        Args:
+            n8n_client: n8n API client instance
+        """
+        super().__init__(n8n_client)
+        # (query, active_only) -> (monotonic time, client cache generation,
+        # workflow summaries); entries go stale when a workflow changes
+        self._results: Dict[Tuple[str, bool], Tuple[float, Optional[int], List[Dict[str, Any]]]] = {}
+
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool to search workflows."""
-        self._validate_required_args(arguments, ["query"])
+        self._validate_required_args(arguments)
 
         query = arguments["query"]
         active_only = arguments.get("active_only", False)
 
-        # Search workflows
-        active_filter = True if active_only else None
-        workflows = await self.n8n_client.search_workflows(query, active=active_filter)
+        # Matching is case-insensitive, so equivalent queries share an entry
+        normalized_query = query.strip().lower()
+        key = (normalized_query, bool(active_only))
+        generation = self.n8n_client.cache_generation
+
+        entry = self._results.get(key)
+        if (
+            generation is not None
+            and entry is not None
+            and entry[1] == generation
+            and time.monotonic() - entry[0] < _SEARCH_CACHE_TTL
+        ):
+            summaries = entry[2]
+            # Move the hit to the end so eviction drops the least recently used
+            self._results[key] = self._results.pop(key)
+        else:
+            active_filter = True if active_only else None
+            workflows = await self.n8n_client.search_workflows(
+                normalized_query, active=active_filter
+            )
+            summaries = list(map(_summarize_workflow, workflows))
+
+            if generation is not None:
+                self._results.pop(key, None)
+                self._results[key] = (time.monotonic(), generation, summaries)
+                if len(self._results) > _SEARCH_CACHE_SIZE:
+                    del self._results[next(iter(self._results))]
 
         return {
             "query": query,
-            "total_matches": len(workflows),
+            "total_matches": len(summaries),
             "active_filter": active_only,
-            "workflows": [
-                {
-                    "id": w.get("id"),
-                    "name": w.get("name"),
-                    "active": w.get("active", False),
-                    "tags": w.get("tags", []),
-                    "created_at": w.get("createdAt"),
-                    "updated_at": w.get("updatedAt")
-                }
-                for w in workflows
-            ]
+            "workflows": summaries
         }
@@ -5,9 +5,50 @@ This script tests the MCP server running in HTTP mode.
 """
 
 import asyncio
+import importlib.util
 import httpx
+import orjson
 import sys
-from typing import Dict, Any
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Seconds a /health response is reused by MCPHTTPClient.health_check
+_HEALTH_CACHE_TTL = 2.0
+
+# Connection pool shared by every MCPHTTPClient, see _get_shared_client
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to the server alive between
+    calls instead of opening a new one for every MCPHTTPClient. When the
+    server is reached over HTTPS through a proxy that speaks HTTP/2 (see
+    HTTP_API.md), concurrent checks share one multiplexed connection.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            # Fail fast on a dead or unreachable server instead of waiting
+            # out one timeout for every phase of every request
+            timeout=httpx.Timeout(connect=2.0, read=10.0, write=5.0, pool=1.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
 
 
 class MCPHTTPClient:
@@ -20,200 +61,353 @@ class MCPHTTPClient:
             base_url: Base URL of MCP server
         """
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = _get_shared_client()
+        # (monotonic fetch time, payload) of the last /health response
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Serialized /call bodies, keyed by tool and sorted arguments
+        self._call_bodies: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], bytes] = {}
+
+    async def health_check(self, force: bool = False) -> Dict[str, Any]:
+        """Check server health.
+
+        Responses are reused for _HEALTH_CACHE_TTL seconds, so repeated or
+        looped checks don't hit /health every time.
+
+        Args:
+            force: Skip the cache and always query the server
+
+        Returns:
+            Health payload
+        """
+        if not force and self._health_cache is not None:
+            fetched_at, health = self._health_cache
+            if time.monotonic() - fetched_at < _HEALTH_CACHE_TTL:
+                return health
 
-    async def health_check(self) -> Dict[str, Any]:
-        """Check server health."""
         response = await self.client.get(f"{self.base_url}/health")
         response.raise_for_status()
-        return response.json()
+        health = await self._json(response)
+        self._health_cache = (time.monotonic(), health)
+        return health
 
     async def list_tools(self) -> Dict[str, Any]:
         """List available tools."""
         response = await self.client.get(f"{self.base_url}/tools")
         response.raise_for_status()
-        return response.json()
+        return await self._json(response)
 
-    async def call_tool(self, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    async def call_tool(
+        self,
+        tool: str,
+        arguments: Dict[str, Any],
+        parse: bool = True
+    ) -> Dict[str, Any]:
         """Call an MCP tool.
 
         Args:
             tool: Tool name
             arguments: Tool arguments
+            parse: Read and decode the response body. When False the body
+                is never downloaded and only the outcome is returned, as
+                {"success": bool, "status_code": int}, without raising for
+                error statuses.
 
         Returns:
             Tool result
         """
+        url = f"{self.base_url}/call"
+        body = self._call_body(tool, arguments)
+        headers = {"Content-Type": "application/json"}
+
+        if not parse:
+            async with self.client.stream("POST", url, content=body, headers=headers) as response:
+                return {"success": response.is_success, "status_code": response.status_code}
+
+        response = await self.client.post(url, content=body, headers=headers)
+        response.raise_for_status()
+        return await self._json(response)
+
+    async def call_tools(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Call several MCP tools in one request.
+
+        Args:
+            calls: Calls as {"tool": name, "arguments": {...}} objects
+
+        Returns:
+            One result per call, in order; calls the server rejected are
+            {"error": message, "status": code} entries
+        """
         response = await self.client.post(
-            f"{self.base_url}/call",
-            json={"tool": tool, "arguments": arguments}
+            f"{self.base_url}/call/batch",
+            content=orjson.dumps(calls),
+            headers={"Content-Type": "application/json"}
         )
         response.raise_for_status()
-        return response.json()
+        return (await self._json(response))["results"]
+
+    def _call_body(self, tool: str, arguments: Dict[str, Any]) -> bytes:
+        """Serialize a /call request body, reusing it for repeated calls.
+
+        Args:
+            tool: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            JSON encoded request body
+        """
+        try:
+            key = (tool, tuple(sorted(arguments.items())))
+            body = self._call_bodies.get(key)
+        except TypeError:
+            # Nested argument values aren't hashable, so don't memoize
+            return orjson.dumps({"tool": tool, "arguments": arguments})
+
+        if body is None:
+            body = orjson.dumps({"tool": tool, "arguments": arguments})
+            self._call_bodies[key] = body
+        return body
+
+    async def _json(self, response: httpx.Response) -> Any:
+        """Parse a JSON response body.
+
+        orjson parses the raw bytes directly, skipping the bytes-to-str
+        decode and the slower stdlib parser behind response.json().
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded JSON body
+        """
+        return orjson.loads(await response.aread())
 
     async def close(self) -> None:
-        """Close client."""
-        await self.client.aclose()
+        """Close client.
 
+        The connection pool is shared between clients, so this does nothing;
+        use close_shared_client() once all clients are done.
+        """
 
-async def test_http_api():
-    """Run HTTP API tests."""
-    print("🧪 Testing MCP Server HTTP API")
-    print("=" * 60)
-    print()
 
-    client = MCPHTTPClient()
+SubTestResult = Tuple[bool, List[str]]
+
 
+async def _test_health(client: MCPHTTPClient) -> SubTestResult:
+    """Check server health."""
     try:
-        # Test 1: Health Check
-        print("1️⃣  Testing Health Check...")
-        try:
-            health = await client.health_check()
-            print(f"   ✅ Server is {health['status']}")
-            print(f"   ✅ n8n: {health.get('n8n', {}).get('status', 'unknown')}")
-            print(f"   ✅ Tools: {health.get('tools_count', 0)}")
-        except Exception as e:
-            print(f"   ❌ Health check failed: {e}")
-            return False
-        print()
+        health = await client.health_check(force=True)
+    except Exception as e:
+        return False, [f"   ❌ Health check failed: {e}"]
+    return True, [
+        f"   ✅ Server is {health['status']}",
+        f"   ✅ n8n: {health.get('n8n', {}).get('status', 'unknown')}",
+        f"   ✅ Tools: {health.get('tools_count', 0)}",
+    ]
 
-        # Test 2: List Tools
-        print("2️⃣  Testing List Tools...")
-        try:
-            tools = await client.list_tools()
-            tool_count = tools.get('count', 0)
-            print(f"   ✅ Found {tool_count} tools")
-            for tool in tools.get('tools', [])[:3]:
-                print(f"      - {tool['name']}")
-            if tool_count > 3:
-                print(f"      ... and {tool_count - 3} more")
-        except Exception as e:
-            print(f"   ❌ List tools failed: {e}")
-            return False
-        print()
 
-        # Test 3: List Workflows
-        print("3️⃣  Testing List Workflows Tool...")
-        try:
-            result = await client.call_tool(
-                "list_workflows",
-                {"status": "all"}
-            )
-            if result.get('success'):
-                data = result.get('data', {})
-                count = data.get('total_count', 0)
-                print(f"   ✅ Found {count} workflows")
-                workflows = data.get('workflows', [])
-                for wf in workflows[:3]:
-                    status = '🟢' if wf.get('active') else '⚪'
-                    print(f"      {status} {wf.get('name')} (ID: {wf.get('id')})")
-                if count > 3:
-                    print(f"      ... and {count - 3} more")
-            else:
-                error = result.get('error', {})
-                print(f"   ⚠️  Tool returned error: {error.get('message')}")
-        except Exception as e:
-            print(f"   ❌ List workflows failed: {e}")
-            return False
-        print()
+async def _test_list_tools(client: MCPHTTPClient) -> SubTestResult:
+    """List the available tools."""
+    try:
+        tools = await client.list_tools()
+    except Exception as e:
+        return False, [f"   ❌ List tools failed: {e}"]
+    tool_count = tools.get('count', 0)
+    lines = [f"   ✅ Found {tool_count} tools"]
+    for tool in tools.get('tools', [])[:3]:
+        lines.append(f"      - {tool['name']}")
+    if tool_count > 3:
+        lines.append(f"      ... and {tool_count - 3} more")
+    return True, lines
 
-        # Test 4: Search Workflows
-        print("4️⃣  Testing Search Workflows Tool...")
-        try:
-            result = await client.call_tool(
-                "search_workflows",
-                {"query": "test"}
-            )
-            if result.get('success'):
-                data = result.get('data', {})
-                matches = data.get('total_matches', 0)
-                print(f"   ✅ Search found {matches} matches for 'test'")
-            else:
-                error = result.get('error', {})
-                print(f"   ⚠️  Tool returned error: {error.get('message')}")
-        except Exception as e:
-            print(f"   ❌ Search workflows failed: {e}")
+
+def _tool_error(result: Dict[str, Any]) -> Optional[SubTestResult]:
+    """Report a batched call the server rejected or the tool failed."""
+    if 'status' in result:
+        return False, [f"   ❌ Call failed ({result['status']}): {result.get('error')}"]
+    if not result.get('success'):
+        error = result.get('error', {})
+        return True, [f"   ⚠️  Tool returned error: {error.get('message')}"]
+    return None
+
+
+def _check_list_workflows(result: Dict[str, Any]) -> SubTestResult:
+    """Check the list_workflows tool result."""
+    error = _tool_error(result)
+    if error is not None:
+        return error
+    data = result.get('data', {})
+    count = data.get('total_count', 0)
+    lines = [f"   ✅ Found {count} workflows"]
+    for wf in data.get('workflows', [])[:3]:
+        status = '🟢' if wf.get('active') else '⚪'
+        lines.append(f"      {status} {wf.get('name')} (ID: {wf.get('id')})")
+    if count > 3:
+        lines.append(f"      ... and {count - 3} more")
+    return True, lines
+
+
+def _check_search_workflows(result: Dict[str, Any]) -> SubTestResult:
+    """Check the search_workflows tool result."""
+    error = _tool_error(result)
+    if error is not None:
+        return error
+    matches = result.get('data', {}).get('total_matches', 0)
+    return True, [f"   ✅ Search found {matches} matches for 'test'"]
+
+
+def _check_get_executions(result: Dict[str, Any]) -> SubTestResult:
+    """Check the get_executions tool result."""
+    error = _tool_error(result)
+    if error is not None:
+        return error
+    data = result.get('data', {})
+    total = data.get('total_count', 0)
+    success = data.get('success_count', 0)
+    errors = data.get('error_count', 0)
+    return True, [
+        f"   ✅ Recent executions: {total} total, {success} success, {errors} errors"
+    ]
+
+
+async def _test_invalid_tool(client: MCPHTTPClient) -> SubTestResult:
+    """Check that an unknown tool is rejected (never fails the run)."""
+    try:
+        result = await client.call_tool("invalid_tool_name", {}, parse=False)
+    except Exception as e:
+        return True, [f"   ⚠️  Unexpected error: {e}"]
+    if result['status_code'] == 404:
+        return True, ["   ✅ Server correctly returned 404 for invalid tool"]
+    if not result['success']:
+        return True, [f"   ⚠️  Unexpected status code: {result['status_code']}"]
+    return True, ["   ⚠️  Expected error but got success"]
+
+
+# Tool calls sent together through POST /call/batch, with the check for
+# each result
+_BATCHED_CALLS: Tuple[Tuple[str, str, Dict[str, Any], Callable[[Dict[str, Any]], SubTestResult]], ...] = (
+    ("3️⃣  Testing List Workflows Tool...", "list_workflows", {"status": "all"},
+     _check_list_workflows),
+    ("4️⃣  Testing Search Workflows Tool...", "search_workflows", {"query": "test"},
+     _check_search_workflows),
+    ("5️⃣  Testing Get Executions Tool...", "get_executions", {"limit": 5},
+     _check_get_executions),
+)
+
+
+async def _test_batched_calls(client: MCPHTTPClient) -> List[SubTestResult]:
+    """Run the batched tool calls in one request and check each result."""
+    try:
+        results = await client.call_tools([
+            {"tool": tool, "arguments": arguments}
+            for _, tool, arguments, _ in _BATCHED_CALLS
+        ])
+    except Exception as e:
+        return [(False, [f"   ❌ Batch call failed: {e}"])] * len(_BATCHED_CALLS)
+    return [
+        check(result)
+        for (_, _, _, check), result in zip(_BATCHED_CALLS, results)
+    ]
+
+
+async def test_http_api():
+    """Run HTTP API tests.
+
+    Output is collected and written to stdout in one go when the run ends.
+    """
+    out: List[str] = []
+    log = out.append
+
+    log("🧪 Testing MCP Server HTTP API")
+    log("=" * 60)
+    log("")
+
+    client = MCPHTTPClient()
+
+    try:
+        # Test 1: Health Check gates the others
+        log("1️⃣  Testing Health Check...")
+        ok, lines = await _test_health(client)
+        out.extend(lines)
+        if not ok:
             return False
-        print()
+        log("")
 
-        # Test 5: Get Executions
-        print("5️⃣  Testing Get Executions Tool...")
-        try:
-            result = await client.call_tool(
-                "get_executions",
-                {"limit": 5}
-            )
-            if result.get('success'):
-                data = result.get('data', {})
-                total = data.get('total_count', 0)
-                success = data.get('success_count', 0)
-                errors = data.get('error_count', 0)
-                print(f"   ✅ Recent executions: {total} total, {success} success, {errors} errors")
+        # Tests 2-6 run concurrently, 3-5 as one batched request; report
+        # them in order
+        tools_result, batched_results, invalid_result = await asyncio.gather(
+            _test_list_tools(client),
+            _test_batched_calls(client),
+            _test_invalid_tool(client),
+            return_exceptions=True
+        )
+        if isinstance(batched_results, BaseException):
+            batched_results = [batched_results] * len(_BATCHED_CALLS)
+        reports = [("2️⃣  Testing List Tools...", tools_result)]
+        reports += [
+            (title, result)
+            for (title, _, _, _), result in zip(_BATCHED_CALLS, batched_results)
+        ]
+        reports.append(("6️⃣  Testing Error Handling (invalid tool)...", invalid_result))
+
+        all_ok = True
+        for title, result in reports:
+            log(title)
+            if isinstance(result, BaseException):
+                ok, lines = False, [f"   ❌ Unexpected error: {result}"]
             else:
-                error = result.get('error', {})
-                print(f"   ⚠️  Tool returned error: {error.get('message')}")
-        except Exception as e:
-            print(f"   ❌ Get executions failed: {e}")
+                ok, lines = result
+            out.extend(lines)
+            log("")
+            all_ok = all_ok and ok
+        if not all_ok:
             return False
-        print()
 
-        # Test 6: Error Handling
-        print("6️⃣  Testing Error Handling (invalid tool)...")
-        try:
-            result = await client.call_tool(
-                "invalid_tool_name",
-                {}
-            )
-            if not result.get('success'):
-                print(f"   ✅ Server correctly returned error for invalid tool")
-            else:
-                print(f"   ⚠️  Expected error but got success")
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                print(f"   ✅ Server correctly returned 404 for invalid tool")
-            else:
-                print(f"   ⚠️  Unexpected status code: {e.response.status_code}")
-        except Exception as e:
-            print(f"   ⚠️  Unexpected error: {e}")
-        print()
-
-        print("=" * 60)
-        print("✅ All HTTP API tests passed!")
-        print()
-        print("🎉 MCP Server HTTP mode is working correctly!")
-        print()
-        print("Next steps:")
-        print("  - Use curl: curl http://localhost:8001/health")
-        print("  - Use Python: See test_http_api.py for examples")
-        print("  - See HTTP_API.md for full documentation")
-        print()
+        log("=" * 60)
+        log("✅ All HTTP API tests passed!")
+        log("")
+        log("🎉 MCP Server HTTP mode is working correctly!")
+        log("")
+        log("Next steps:")
+        log("  - Use curl: curl http://localhost:8001/health")
+        log("  - Use Python: See test_http_api.py for examples")
+        log("  - See HTTP_API.md for full documentation")
+        log("")
 
         return True
 
     except httpx.ConnectError:
-        print()
-        print("❌ Could not connect to MCP server")
-        print()
-        print("Make sure the server is running in HTTP mode:")
-        print("  MCP_SERVER_MODE=http python -m src.server")
-        print()
-        print("Or with Docker:")
-        print("  docker-compose up -d")
-        print()
+        log("")
+        log("❌ Could not connect to MCP server")
+        log("")
+        log("Make sure the server is running in HTTP mode:")
+        log("  MCP_SERVER_MODE=http python -m src.server")
+        log("")
+        log("Or with Docker:")
+        log("  docker-compose up -d")
+        log("")
         return False
 
     except Exception as e:
-        print()
-        print(f"❌ Unexpected error: {e}")
-        print()
+        log("")
+        log(f"❌ Unexpected error: {e}")
+        log("")
         return False
 
     finally:
-        await client.close()
+        await close_shared_client()
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
     """Main entry point."""
+    try:
+        # uvloop's libuv event loop is faster for socket-heavy runs; it is
+        # optional and not available on Windows
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         success = asyncio.run(test_http_api())
         sys.exit(0 if success else 1)
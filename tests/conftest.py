@@ -0,0 +1,16 @@
+"""Shared pytest configuration."""
+
+import pytest
+from pytest_asyncio import is_async_test
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session's event loop.
+
+    The tests only await in-memory mocks, so creating and closing a fresh
+    event loop per test is pure overhead.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
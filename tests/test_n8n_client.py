@@ -1,45 +1,132 @@
 """Tests for n8n client."""
 
 import pytest
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
 from src.n8n_client import (
     N8NClient,
+    aclose_all,
+    get_client,
     N8NError,
     N8NConnectionError,
     N8NAuthError,
     N8NNotFoundError,
     N8NValidationError,
+    N8NUnsupportedError,
 )
 from src.config import Config
 
 
-@pytest.fixture
+_HEADERS = MappingProxyType({
+    "X-N8N-API-KEY": "test-api-key",
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+})
+
+
+def _unexpected_request(request):
+    """MockTransport handler for requests no test stubbed out."""
+    raise AssertionError(f"Unexpected request to n8n: {request.method} {request.url}")
+
+
+@pytest.fixture(scope="session")
 def mock_config():
-    """Create a mock configuration."""
+    """Create a mock configuration, shared by every test since none changes it."""
     config = MagicMock(spec=Config)
     config.n8n_url = "http://localhost:5678"
     config.n8n_api_key = "test-api-key"
     config.n8n_timeout = 30
     config.n8n_max_retries = 3
-    config.get_n8n_api_base_url.return_value = "http://localhost:5678/api/v1"
-    config.get_n8n_headers.return_value = {
-        "X-N8N-API-KEY": "test-api-key",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    config.n8n_http2 = False
+    config.n8n_exclude_pinned_data = False
+    config.n8n_max_connections = 100
+    config.n8n_max_keepalive = 100
+    config.n8n_keepalive_expiry = 30.0
+    config.n8n_max_concurrency = 32
+    config.n8n_execution_batch_window_ms = 5.0
+    config.n8n_execution_max_batch = 32
+    config.enable_caching = True
+    config.cache_ttl = 60
+    config.cache_max_entries = 512
+    config.n8n_api_base_url = "http://localhost:5678/api/v1"
+    config.n8n_headers = _HEADERS
     return config
 
 
 @pytest.fixture
 async def n8n_client(mock_config):
-    """Create an n8n client instance."""
-    client = N8NClient(mock_config)
+    """Create an n8n client instance that never opens a real connection.
+
+    The client is rebuilt per test because it holds caches and in-flight
+    request state, but over MockTransport that costs no connection pool.
+    """
+    client = N8NClient(mock_config, transport=httpx.MockTransport(_unexpected_request))
     yield client
     await client.close()
 
 
+@pytest.fixture
+def mock_request(n8n_client, monkeypatch):
+    """Replace the client's _request with an AsyncMock for one test."""
+    mock = AsyncMock()
+    monkeypatch.setattr(n8n_client, "_request", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_fetch(n8n_client, monkeypatch):
+    """Replace the client's uncached workflow fetch with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(n8n_client, "_fetch_workflow", mock)
+    return mock
+
+
+_WORKFLOWS = [
+    {"id": "1", "name": "Workflow 1", "active": True},
+    {"id": "2", "name": "Workflow 2", "active": False}
+]
+_WORKFLOW = {"id": "1", "name": "Test Workflow", "active": True, "nodes": []}
+_NEW_WORKFLOW = {"name": "New Workflow", "nodes": [], "connections": {}, "active": False}
+_EXECUTION = {"id": "exec-1", "workflowId": "1", "finished": True, "mode": "manual"}
+_EXECUTIONS = [
+    {"id": "exec-1", "finished": True},
+    {"id": "exec-2", "finished": False}
+]
+_TAGGED_WORKFLOWS = (
+    {"id": "1", "name": "Email Workflow", "tags": ["email"]},
+    {"id": "2", "name": "Data Sync", "tags": ["email", "sync"]},
+    {"id": "3", "name": "Notification", "tags": ["notify"]},
+)
+_STATS_EXECUTIONS = (
+    {"id": "1", "finished": True, "stoppedAt": None},
+    {"id": "2", "finished": True, "stoppedAt": None},
+    {"id": "3", "finished": False, "stoppedAt": "2024-01-01"},
+)
+
+# (client method, positional arguments, keyword arguments, _request response,
+# expected _request call as (method, path, kwargs), expected result)
+_REQUEST_CASES = [
+    ("list_workflows", (), {}, {"data": _WORKFLOWS},
+     ("GET", "/workflows", {"params": {}}), _WORKFLOWS),
+    ("list_workflows", (), {"active": True}, {"data": _WORKFLOWS[:1]},
+     ("GET", "/workflows", {"params": {"active": "true"}}), _WORKFLOWS[:1]),
+    ("create_workflow", (_NEW_WORKFLOW,), {}, {**_NEW_WORKFLOW, "id": "123"},
+     ("POST", "/workflows", {"json": _NEW_WORKFLOW}), {**_NEW_WORKFLOW, "id": "123"}),
+    ("update_workflow", ("1", {"name": "Updated Workflow"}), {},
+     {"id": "1", "name": "Updated Workflow", "active": True},
+     ("PUT", "/workflows/1", {"json": {"name": "Updated Workflow"}}),
+     {"id": "1", "name": "Updated Workflow", "active": True}),
+    ("delete_workflow", ("1",), {}, {},
+     ("DELETE", "/workflows/1", {}), True),
+    ("execute_workflow", ("1", {"input": "test"}), {}, _EXECUTION,
+     ("POST", "/workflows/1/execute", {"json": {"data": {"input": "test"}}}), _EXECUTION),
+    ("get_executions", (), {"limit": 10}, {"data": _EXECUTIONS},
+     ("GET", "/executions", {"params": {"limit": 10}}), _EXECUTIONS),
+]
+
+
 class TestN8NClient:
     """Test suite for N8NClient."""
 
@@ -52,225 +139,310 @@ class TestN8NClient:
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_health_check_success(self, n8n_client):
+    async def test_health_check_success(self, n8n_client, mock_request):
         """Test successful health check."""
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {"data": []}
+        mock_request.return_value = {"data": []}
 
-            health = await n8n_client.health_check()
+        health = await n8n_client.health_check()
 
-            assert health["status"] == "healthy"
-            assert "Successfully connected" in health["message"]
-            mock_request.assert_called_once()
+        assert health["status"] == "healthy"
+        assert "Successfully connected" in health["message"]
+        # The probe goes through the authenticated API
+        mock_request.assert_called_once_with("HEAD", "/workflows", params=None)
 
     @pytest.mark.asyncio
-    async def test_health_check_failure(self, n8n_client):
-        """Test failed health check."""
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = N8NConnectionError("Connection failed")
-
-            with pytest.raises(N8NConnectionError):
-                await n8n_client.health_check()
+    async def test_health_check_falls_back_and_remembers_probe(self, n8n_client, mock_request):
+        """Test falling back from HEAD and reusing the working probe."""
+        mock_request.side_effect = [N8NUnsupportedError("Method not allowed"), {}, {}]
+
+        await n8n_client.health_check()
+        await n8n_client.health_check()
+
+        probes = [(c.args, c.kwargs) for c in mock_request.call_args_list]
+        assert probes == [
+            (("HEAD", "/workflows"), {"params": None}),
+            (("GET", "/workflows"), {"params": {"limit": 1}}),
+            (("GET", "/workflows"), {"params": {"limit": 1}}),
+        ]
 
     @pytest.mark.asyncio
-    async def test_list_workflows(self, n8n_client):
-        """Test listing workflows."""
-        mock_workflows = [
-            {"id": "1", "name": "Workflow 1", "active": True},
-            {"id": "2", "name": "Workflow 2", "active": False}
-        ]
+    async def test_health_check_rejects_invalid_api_key(self, mock_config):
+        """Test a live n8n with a rejected API key is not reported healthy."""
+        def handler(request):
+            if request.url.path == "/healthz":
+                return httpx.Response(200, json={"status": "ok"})
+            return httpx.Response(401, json={"message": "Unauthorized"})
+
+        client = N8NClient(mock_config, transport=httpx.MockTransport(handler))
+        try:
+            with pytest.raises(N8NConnectionError, match="Unauthorized"):
+                await client.health_check()
+        finally:
+            await client.close()
 
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {"data": mock_workflows}
+    @pytest.mark.asyncio
+    async def test_health_check_failure(self, n8n_client, mock_request):
+        """Test failed health check."""
+        mock_request.side_effect = N8NConnectionError("Connection failed")
 
-            workflows = await n8n_client.list_workflows()
+        with pytest.raises(N8NConnectionError):
+            await n8n_client.health_check()
 
-            assert len(workflows) == 2
-            assert workflows[0]["name"] == "Workflow 1"
-            mock_request.assert_called_once_with("GET", "/workflows", params={})
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,args,kwargs,response,expected_call,expected",
+        _REQUEST_CASES,
+        ids=[case[0] for case in _REQUEST_CASES]
+    )
+    async def test_request_mapping(
+        self, n8n_client, mock_request, method, args, kwargs, response, expected_call, expected
+    ):
+        """Test each client method issues its n8n request and unwraps the response."""
+        mock_request.return_value = response
+
+        result = await getattr(n8n_client, method)(*args, **kwargs)
+
+        assert result == expected
+        http_method, path, request_kwargs = expected_call
+        mock_request.assert_called_once_with(http_method, path, **request_kwargs)
 
     @pytest.mark.asyncio
-    async def test_list_workflows_with_filter(self, n8n_client):
-        """Test listing workflows with active filter."""
-        mock_workflows = [{"id": "1", "name": "Workflow 1", "active": True}]
+    async def test_list_workflows_excludes_pinned_data(
+        self, n8n_client, mock_request, monkeypatch
+    ):
+        """Test workflow lists ask n8n to leave out pinned data."""
+        monkeypatch.setattr(n8n_client.config, "n8n_exclude_pinned_data", True)
 
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {"data": mock_workflows}
+        mock_request.return_value = {"data": []}
 
-            workflows = await n8n_client.list_workflows(active=True)
+        await n8n_client.list_workflows()
 
-            assert len(workflows) == 1
-            mock_request.assert_called_once_with(
-                "GET", "/workflows", params={"active": "true"}
-            )
+        mock_request.assert_called_once_with(
+            "GET", "/workflows", params={"excludePinnedData": "true"}
+        )
 
     @pytest.mark.asyncio
-    async def test_get_workflow(self, n8n_client):
-        """Test getting a specific workflow."""
-        mock_workflow = {
-            "id": "1",
-            "name": "Test Workflow",
-            "active": True,
-            "nodes": []
-        }
+    async def test_iter_workflows_follows_cursor(self, n8n_client, mock_request):
+        """Test iterating workflows across cursor-paginated pages."""
+        pages = [
+            {"data": [{"id": "1"}, {"id": "2"}], "nextCursor": "abc"},
+            {"data": [{"id": "3"}], "nextCursor": None},
+        ]
 
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_workflow
+        mock_request.side_effect = pages
 
-            workflow = await n8n_client.get_workflow("1")
+        ids = [w["id"] async for w in n8n_client.iter_workflows(page_size=2)]
 
-            assert workflow["name"] == "Test Workflow"
-            mock_request.assert_called_once_with("GET", "/workflows/1")
+        assert ids == ["1", "2", "3"]
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.kwargs["params"] == {"limit": 2, "cursor": "abc"}
 
     @pytest.mark.asyncio
-    async def test_get_workflow_not_found(self, n8n_client):
-        """Test getting non-existent workflow."""
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = N8NNotFoundError("Workflow not found")
+    async def test_workflow_reads_are_cached(self, n8n_client, mock_request, mock_fetch):
+        """Test cached reads and invalidation on update."""
+        mock_fetch.return_value = {"id": "1", "name": "Test Workflow"}
 
-            with pytest.raises(N8NNotFoundError):
-                await n8n_client.get_workflow("999")
+        await n8n_client.get_workflow("1")
+        await n8n_client.get_workflow("1")
+        assert mock_fetch.call_count == 1
+
+        await n8n_client.update_workflow("1", {"name": "Renamed"})
+        await n8n_client.get_workflow("1")
+        assert mock_fetch.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_create_workflow(self, n8n_client):
-        """Test creating a workflow."""
-        workflow_data = {
-            "name": "New Workflow",
-            "nodes": [],
-            "connections": {},
-            "active": False
-        }
+    async def test_read_racing_mutation_not_cached(self, n8n_client, mock_fetch):
+        """Test a read that overlapped an invalidation is not cached."""
+        async def fetch_during_delete(workflow_id):
+            n8n_client.invalidate_workflow_cache(workflow_id)
+            return {"id": workflow_id, "name": "Test Workflow"}
 
-        mock_created = {**workflow_data, "id": "123"}
+        mock_fetch.side_effect = fetch_during_delete
 
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_created
+        await n8n_client.get_workflow("1")
 
-            workflow = await n8n_client.create_workflow(workflow_data)
-
-            assert workflow["id"] == "123"
-            assert workflow["name"] == "New Workflow"
-            mock_request.assert_called_once_with(
-                "POST", "/workflows", json=workflow_data
-            )
+        assert n8n_client.peek_workflow("1") is None
 
     @pytest.mark.asyncio
-    async def test_update_workflow(self, n8n_client):
-        """Test updating a workflow."""
-        workflow_data = {"name": "Updated Workflow"}
+    async def test_workflow_cache_evicts_least_recently_used(
+        self, n8n_client, mock_fetch, monkeypatch
+    ):
+        """Test the workflow cache stays within its size bound."""
+        monkeypatch.setattr(n8n_client.config, "cache_max_entries", 2)
 
-        mock_updated = {
-            "id": "1",
-            "name": "Updated Workflow",
-            "active": True
-        }
+        mock_fetch.return_value = {"id": "1"}
 
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_updated
+        await n8n_client.get_workflow("1")
+        await n8n_client.get_workflow("2")
+        await n8n_client.get_workflow("1")
+        await n8n_client.get_workflow("3")
 
-            workflow = await n8n_client.update_workflow("1", workflow_data)
+        assert list(n8n_client._workflow_cache) == [("workflow", "1"), ("workflow", "3")]
 
-            assert workflow["name"] == "Updated Workflow"
-            mock_request.assert_called_once_with(
-                "PUT", "/workflows/1", json=workflow_data
-            )
+    @pytest.mark.asyncio
+    async def test_expired_workflow_revalidated(self, mock_config):
+        """Test a fetched workflow's ETag is sent when revalidating it after expiry."""
+        workflow = {"id": "1", "name": "Test", "updatedAt": "2024-01-02T03:04:05.000Z"}
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(200, json=workflow, headers={"ETag": 'W/"abc"'})
+            return httpx.Response(304)
+
+        client = N8NClient(mock_config, transport=httpx.MockTransport(handler))
+        try:
+            assert await client.get_workflow("1") == workflow
+
+            # Expire the cached copy
+            client._workflow_cache[("workflow", "1")] = (float("-inf"), workflow)
+            assert await client.get_workflow("1") == workflow
+        finally:
+            await client.close()
+
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == 'W/"abc"'
+        assert requests[1].headers["If-Modified-Since"] == "Tue, 02 Jan 2024 03:04:05 GMT"
 
     @pytest.mark.asyncio
-    async def test_delete_workflow(self, n8n_client):
-        """Test deleting a workflow."""
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {}
+    async def test_get_workflow_not_found(self, mock_config):
+        """Test getting non-existent workflow."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(404, json={"message": "Workflow not found"})
+        )
+        client = N8NClient(mock_config, transport=transport)
+        try:
+            with pytest.raises(N8NNotFoundError):
+                await client.get_workflow("999")
+        finally:
+            await client.close()
 
-            result = await n8n_client.delete_workflow("1")
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("action,active", [("activate", True), ("deactivate", False)])
+    async def test_toggle_workflow(self, n8n_client, mock_request, action, active):
+        """Test (de)activating a workflow via the dedicated endpoint."""
+        mock_request.return_value = {"id": "1", "name": "Test", "active": active}
 
-            assert result is True
-            mock_request.assert_called_once_with("DELETE", "/workflows/1")
+        workflow = await getattr(n8n_client, f"{action}_workflow")("1")
 
-    @pytest.mark.asyncio
-    async def test_activate_workflow(self, n8n_client):
-        """Test activating a workflow."""
-        mock_workflow = {"id": "1", "name": "Test", "active": False}
-        mock_updated = {**mock_workflow, "active": True}
+        assert workflow["active"] is active
+        mock_request.assert_called_once_with("POST", f"/workflows/1/{action}")
 
-        with patch.object(n8n_client, 'get_workflow', new_callable=AsyncMock) as mock_get:
-            with patch.object(n8n_client, 'update_workflow', new_callable=AsyncMock) as mock_update:
-                mock_get.return_value = mock_workflow
-                mock_update.return_value = mock_updated
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("action,active", [("activate", True), ("deactivate", False)])
+    async def test_toggle_workflow_fallback(self, n8n_client, mock_request, action, active):
+        """Test falling back to GET+PUT when the (de)activate endpoint is missing."""
+        mock_workflow = {
+            "id": "1",
+            "name": "Test",
+            "active": not active,
+            "createdAt": "2024-01-01",
+            "updatedAt": "2024-01-02",
+            "versionId": "v1"
+        }
+        mock_send = AsyncMock(return_value=mock_workflow)
+        mock_update = AsyncMock(return_value={**mock_workflow, "active": active})
 
-                workflow = await n8n_client.activate_workflow("1")
+        mock_request.side_effect = N8NNotFoundError("Not found")
+        with patch.multiple(n8n_client, _send=mock_send, update_workflow=mock_update):
+            workflow = await getattr(n8n_client, f"{action}_workflow")("1")
 
-                assert workflow["active"] is True
-                mock_get.assert_called_once_with("1")
-                mock_update.assert_called_once()
+        assert workflow["active"] is active
+        # The workflow is read fresh rather than from the cache
+        mock_send.assert_called_once_with("GET", "/workflows/1")
+        mock_update.assert_called_once_with("1", {"name": "Test", "active": active})
 
     @pytest.mark.asyncio
-    async def test_deactivate_workflow(self, n8n_client):
-        """Test deactivating a workflow."""
-        mock_workflow = {"id": "1", "name": "Test", "active": True}
-        mock_updated = {**mock_workflow, "active": False}
-
-        with patch.object(n8n_client, 'get_workflow', new_callable=AsyncMock) as mock_get:
-            with patch.object(n8n_client, 'update_workflow', new_callable=AsyncMock) as mock_update:
-                mock_get.return_value = mock_workflow
-                mock_update.return_value = mock_updated
+    async def test_patch_workflow(self, n8n_client, mock_request):
+        """Test sending only the changed fields with PATCH."""
+        mock_request.return_value = {"id": "1", "name": "Renamed"}
 
-                workflow = await n8n_client.deactivate_workflow("1")
+        workflow = await n8n_client.patch_workflow("1", {"name": "Renamed"})
 
-                assert workflow["active"] is False
-                mock_get.assert_called_once_with("1")
-                mock_update.assert_called_once()
+        assert workflow["name"] == "Renamed"
+        mock_request.assert_called_once_with(
+            "PATCH", "/workflows/1", json={"name": "Renamed"}
+        )
 
     @pytest.mark.asyncio
-    async def test_execute_workflow(self, n8n_client):
-        """Test executing a workflow."""
-        mock_execution = {
-            "id": "exec-1",
-            "workflowId": "1",
-            "finished": True,
-            "mode": "manual"
+    @pytest.mark.parametrize("rejection", [
+        N8NUnsupportedError("Method not allowed"),
+        N8NNotFoundError("Not found"),
+    ])
+    async def test_patch_workflow_fallback(self, n8n_client, mock_request, rejection):
+        """Test merging with GET+PUT when n8n rejects PATCH."""
+        mock_workflow = {
+            "id": "1",
+            "name": "Test",
+            "active": True,
+            "nodes": [{"name": "Start"}],
+            "connections": {},
+            "settings": {},
+            "tags": [],
+            "versionId": "v1"
         }
 
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_execution
+        mock_request.side_effect = rejection
+        with patch.object(n8n_client, '_send', new_callable=AsyncMock) as mock_send:
+            with patch.object(n8n_client, 'update_workflow', new_callable=AsyncMock) as mock_update:
+                mock_send.return_value = mock_workflow
+                mock_update.return_value = {**mock_workflow, "name": "Renamed"}
+
+                await n8n_client.patch_workflow("1", {"name": "Renamed"})
+                await n8n_client.patch_workflow("1", {"name": "Renamed"})
+
+                # PATCH is not retried once rejected
+                assert mock_request.call_count == 1
+                mock_update.assert_called_with("1", {
+                    "name": "Renamed",
+                    "nodes": [{"name": "Start"}],
+                    "connections": {},
+                    "settings": {},
+                    "tags": [],
+                    "active": True
+                })
 
-            execution = await n8n_client.execute_workflow("1", {"input": "test"})
+    @pytest.mark.asyncio
+    async def test_iter_executions_stops_at_limit(self, n8n_client, mock_request):
+        """Test streaming executions without their data up to a limit."""
+        pages = [
+            {"data": [{"id": "exec-1"}, {"id": "exec-2"}], "nextCursor": "abc"},
+            {"data": [{"id": "exec-3"}, {"id": "exec-4"}], "nextCursor": "def"},
+        ]
 
-            assert execution["id"] == "exec-1"
-            mock_request.assert_called_once_with(
-                "POST",
-                "/workflows/1/execute",
-                json={"data": {"input": "test"}}
-            )
+        mock_request.side_effect = pages
+
+        ids = [e["id"] async for e in n8n_client.iter_executions(limit=3, page_size=2)]
+
+        assert ids == ["exec-1", "exec-2", "exec-3"]
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.kwargs["params"] == {
+            "includeData": "false", "limit": 2, "cursor": "abc"
+        }
 
     @pytest.mark.asyncio
-    async def test_get_executions(self, n8n_client):
-        """Test getting executions."""
-        mock_executions = [
-            {"id": "exec-1", "finished": True},
-            {"id": "exec-2", "finished": False}
+    async def test_get_execution_count(self, n8n_client, mock_request):
+        """Test counting executions across pages with filters pushed down."""
+        pages = [
+            {"data": [{"id": "exec-1"}, {"id": "exec-2"}], "nextCursor": "abc"},
+            {"data": [{"id": "exec-3"}], "nextCursor": None},
         ]
 
-        with patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {"data": mock_executions}
+        mock_request.side_effect = pages
 
-            executions = await n8n_client.get_executions(limit=10)
+        count = await n8n_client.get_execution_count(workflow_id="1", status="error")
 
-            assert len(executions) == 2
-            mock_request.assert_called_once_with(
-                "GET", "/executions", params={"limit": 10}
-            )
+        assert count == 3
+        assert mock_request.call_args_list[0].kwargs["params"] == {
+            "workflowId": "1", "status": "error", "limit": 250
+        }
 
     @pytest.mark.asyncio
     async def test_search_workflows(self, n8n_client):
         """Test searching workflows."""
-        mock_workflows = [
-            {"id": "1", "name": "Email Workflow", "tags": ["email"]},
-            {"id": "2", "name": "Data Sync", "tags": ["email", "sync"]},
-            {"id": "3", "name": "Notification", "tags": ["notify"]}
-        ]
-
         with patch.object(n8n_client, 'list_workflows', new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = mock_workflows
+            mock_list.return_value = _TAGGED_WORKFLOWS
 
             results = await n8n_client.search_workflows("email")
 
@@ -279,35 +451,204 @@ class TestN8NClient:
             assert results[1]["name"] == "Data Sync"
 
     @pytest.mark.asyncio
-    async def test_get_workflow_statistics(self, n8n_client):
-        """Test getting workflow statistics."""
-        mock_executions = [
-            {"id": "1", "finished": True, "stoppedAt": None},
-            {"id": "2", "finished": True, "stoppedAt": None},
-            {"id": "3", "finished": False, "stoppedAt": "2024-01-01"},
+    async def test_search_workflows_max_results(self, n8n_client, mock_request):
+        """Test that a bounded search stops fetching pages once satisfied."""
+        pages = [
+            {"data": [{"id": "1", "name": "Email A"}, {"id": "2", "name": "Sync"}],
+             "nextCursor": "abc"},
+            {"data": [{"id": "3", "name": "Email B"}], "nextCursor": "def"},
+            {"data": [{"id": "4", "name": "Email C"}], "nextCursor": None},
         ]
 
-        with patch.object(n8n_client, 'get_executions', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_executions
+        mock_request.side_effect = pages
+
+        results = await n8n_client.search_workflows("email", max_results=2)
+
+        assert [w["id"] for w in results] == ["1", "3"]
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_workflow_statistics(self, n8n_client, mock_request):
+        """Test getting workflow statistics."""
+        mock_request.return_value = {"data": _STATS_EXECUTIONS, "nextCursor": None}
+
+        stats = await n8n_client.get_workflow_statistics("1", limit=100)
+
+        assert stats["total_executions"] == 3
+        assert stats["success_count"] == 2
+        assert stats["error_count"] == 1
+        assert stats["success_rate"] == 66.67
+        mock_request.assert_called_once_with("GET", "/executions", params={
+            "includeData": "false", "workflowId": "1", "limit": 100
+        })
+
+    @pytest.mark.asyncio
+    async def test_bulk_workflow_statistics(self, n8n_client):
+        """Test bulk statistics keep per-workflow failures separate."""
+        async def fake_stats(workflow_id, limit=100):
+            if workflow_id == "missing":
+                raise N8NNotFoundError("Workflow not found")
+            return {"workflow_id": workflow_id, "total_executions": 0}
+
+        with patch.object(n8n_client, 'get_workflow_statistics', side_effect=fake_stats):
+            results = await n8n_client.bulk_workflow_statistics(["1", "missing", "2"])
+
+            assert list(results) == ["1", "missing", "2"]
+            assert results["1"]["workflow_id"] == "1"
+            assert isinstance(results["missing"], N8NNotFoundError)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_request(self, n8n_client):
+        """Test that identical concurrent GETs hit n8n only once."""
+        import asyncio
+
+        async def slow_send(method, endpoint, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"data": []}
+
+        with patch.object(n8n_client, '_send', side_effect=slow_send) as mock_send:
+            results = await asyncio.gather(
+                n8n_client._request("GET", "/workflows", params={"limit": 1}),
+                n8n_client._request("GET", "/workflows", params={"limit": 1}),
+            )
+
+            assert results == [{"data": []}, {"data": []}]
+            assert mock_send.call_count == 1
 
-            stats = await n8n_client.get_workflow_statistics("1", limit=100)
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_with_list_params_shared(self, n8n_client):
+        """Test that GETs with list-valued params can still be shared."""
+        import asyncio
+
+        async def slow_send(method, endpoint, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"data": []}
+
+        params = {"ids": ["1", "2"], "limit": 2}
+        with patch.object(n8n_client, '_send', side_effect=slow_send) as mock_send:
+            await asyncio.gather(
+                n8n_client._request("GET", "/executions", params=params),
+                n8n_client._request("GET", "/executions", params=dict(params)),
+            )
+
+            assert mock_send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_with_headers_not_shared(self, n8n_client):
+        """Test that GETs carrying their own headers each reach n8n."""
+        import asyncio
+
+        async def slow_send(method, endpoint, **kwargs):
+            await asyncio.sleep(0.01)
+            return kwargs.get("headers")
+
+        with patch.object(n8n_client, '_send', side_effect=slow_send) as mock_send:
+            results = await asyncio.gather(
+                n8n_client._request("GET", "/workflows/1", headers={"If-None-Match": '"a"'}),
+                n8n_client._request("GET", "/workflows/1", headers={"If-None-Match": '"b"'}),
+            )
+
+            assert results == [{"If-None-Match": '"a"'}, {"If-None-Match": '"b"'}]
+            assert mock_send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_execution_batches_lookups(self, n8n_client):
+        """Test that concurrent execution lookups are fetched as one batch."""
+        import asyncio
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "/executions/missing":
+                raise N8NNotFoundError("Execution not found")
+            return {"id": endpoint.rsplit("/", 1)[-1]}
+
+        with patch.object(n8n_client, '_request', side_effect=fake_request) as mock_request:
+            results = await asyncio.gather(
+                n8n_client.get_execution("1"),
+                n8n_client.get_execution("2"),
+                n8n_client.get_execution("missing"),
+                return_exceptions=True
+            )
+
+            assert results[0] == {"id": "1"}
+            assert results[1] == {"id": "2"}
+            assert isinstance(results[2], N8NNotFoundError)
+            assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_execution_unbatched_by_default(self, n8n_client):
+        """Test that lookups skip the batch window unless one is configured."""
+        assert Config.model_fields["n8n_execution_batch_window_ms"].default == 0
+
+        with patch.object(n8n_client.config, 'n8n_execution_batch_window_ms', 0), \
+                patch.object(n8n_client, '_request', new_callable=AsyncMock) as mock_request, \
+                patch.object(n8n_client, '_load_execution') as mock_load:
+            mock_request.return_value = {"id": "1"}
+
+            assert await n8n_client.get_execution("1") == {"id": "1"}
 
-            assert stats["total_executions"] == 3
-            assert stats["success_count"] == 2
-            assert stats["error_count"] == 1
-            assert stats["success_rate"] == 66.67
+            mock_request.assert_called_once_with("GET", "/executions/1")
+            mock_load.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auth_error_handling(self, n8n_client):
-        """Test authentication error handling."""
+    async def test_post_not_retried_on_network_error(self, n8n_client):
+        """Test that non-idempotent requests are sent only once."""
+        with patch.object(n8n_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = httpx.ConnectError("Connection reset")
+
+            with pytest.raises(N8NConnectionError):
+                await n8n_client._request("POST", "/workflows", json={})
+
+            assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_request_body_encoded_with_orjson(self, n8n_client):
+        """Test JSON bodies are sent as pre-encoded content."""
         with patch.object(n8n_client.client, 'request', new_callable=AsyncMock) as mock_request:
             response = MagicMock()
-            response.status_code = 401
-            response.json.return_value = {"message": "Unauthorized"}
-            response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "Unauthorized", request=MagicMock(), response=response
-            )
+            response.status_code = 200
+            response.content = b'{"id": "1"}'
             mock_request.return_value = response
 
-            with pytest.raises(N8NAuthError):
-                await n8n_client._request("GET", "/workflows")
+            result = await n8n_client._request("POST", "/workflows", json={"name": "Test"})
+
+            assert result == {"id": "1"}
+            mock_request.assert_called_once_with(
+                "POST", "/workflows", content=b'{"name":"Test"}'
+            )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code,error_cls", [
+        (400, N8NValidationError),
+        (401, N8NAuthError),
+        (403, N8NAuthError),
+        (404, N8NNotFoundError),
+        (405, N8NUnsupportedError),
+        (500, N8NError),
+    ])
+    async def test_status_error_handling(self, mock_config, status_code, error_cls):
+        """Test HTTP error statuses map to client exceptions with n8n's message."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(status_code, json={"message": "Rejected by n8n"})
+        )
+        client = N8NClient(mock_config, transport=transport)
+        try:
+            with pytest.raises(error_cls, match="Rejected by n8n"):
+                await client._request("GET", "/workflows")
+        finally:
+            await client.close()
+
+
+class TestSharedClient:
+    """Test suite for the shared client registry."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_instance(self, mock_config):
+        """Test that one client is shared per configuration."""
+        client = get_client(mock_config)
+        try:
+            assert get_client(mock_config) is client
+        finally:
+            await aclose_all()
+
+        assert get_client(mock_config) is not client
+        await aclose_all()
@@ -0,0 +1,196 @@
+"""Tests for the MCP server's HTTP endpoints."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.n8n_client import N8NNotFoundError
+from src.server import _MAX_BATCH_CALLS, MonolietMCPServer
+
+# Workflow list served by the stub below; it is never mutated
+_WORKFLOWS = (
+    {"id": "1", "name": "Workflow 1", "active": True, "tags": []},
+    {"id": "2", "name": "Workflow 2", "active": False, "tags": ["test"]},
+)
+
+
+class _StubN8N:
+    """Lightweight stand-in for N8NClient serving canned workflows.
+
+    ``get_workflow`` answers the "slow" workflow last and raises
+    N8NNotFoundError for "missing", so tests can check ordering and
+    error reporting.
+    """
+
+    base_url = "http://n8n.test/api/v1"
+    cache_generation = None
+
+    def __init__(self):
+        self.workflows = list(_WORKFLOWS)
+
+    async def list_workflows(self, **kwargs):
+        return list(self.workflows)
+
+    async def get_workflow(self, workflow_id):
+        if workflow_id == "slow":
+            await asyncio.sleep(0.01)
+        if workflow_id == "missing":
+            raise N8NNotFoundError("Workflow not found")
+        # Non-string keys, as in int-keyed counts
+        return {"id": workflow_id, "name": f"Workflow {workflow_id}", "staticData": {1: 2}}
+
+    def peek_workflow(self, workflow_id):
+        return None
+
+
+@pytest.fixture
+def n8n_stub():
+    """Create a fresh n8n stub."""
+    return _StubN8N()
+
+
+@pytest.fixture
+async def http_client(n8n_stub):
+    """Create a test client for the HTTP app, with tools bound to the stub."""
+    server = MonolietMCPServer()
+    server.n8n_client = n8n_stub
+    # The HTTP endpoints never go through the MCP SDK's handlers
+    server.mcp_server = MagicMock()
+    await server._register_tools()
+
+    client = TestClient(TestServer(server.build_http_app()))
+    await client.start_server()
+    yield client
+    await client.close()
+
+
+def _details(workflow_id):
+    """Build a get_workflow_details call for a batch."""
+    return {"tool": "get_workflow_details", "arguments": {"workflow_id": workflow_id}}
+
+
+class TestCallEndpoint:
+    """Tests for POST /call."""
+
+    @pytest.mark.asyncio
+    async def test_non_string_keys_serialized(self, http_client):
+        """Results with non-string keys should serialize instead of failing."""
+        response = await http_client.post("/call", data=orjson.dumps(_details("1")))
+
+        assert response.status == 200
+        assert (await response.json())["data"]["static_data"] == {"1": 2}
+
+
+class TestBatchEndpoint:
+    """Tests for POST /call/batch."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_request_order(self, http_client):
+        """Results should follow the request order, not completion order."""
+        calls = [_details("slow"), {"tool": "list_workflows"}, _details("1")]
+
+        response = await http_client.post("/call/batch", data=orjson.dumps(calls))
+
+        assert response.status == 200
+        body = await response.json()
+        assert body["count"] == 3
+        assert [r["success"] for r in body["results"]] == [True, True, True]
+        assert body["results"][0]["data"]["id"] == "slow"
+        assert body["results"][1]["data"]["total_count"] == 2
+        assert body["results"][2]["data"]["id"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_failed_calls_reported_per_entry(self, http_client):
+        """A failing call should only fail its own entry."""
+        calls = [
+            {"tool": "no_such_tool"},
+            {"arguments": {}},
+            "not a call",
+            _details("missing"),
+            _details("1"),
+        ]
+
+        response = await http_client.post("/call/batch", data=orjson.dumps(calls))
+
+        assert response.status == 200
+        results = (await response.json())["results"]
+        assert results[0] == {"error": "Unknown tool: no_such_tool", "status": 404}
+        assert results[1] == {"error": "Missing tool name", "status": 400}
+        assert results[2] == {"error": "Request body must be a JSON object", "status": 400}
+        assert results[3]["success"] is False
+        assert results[3]["error"]["type"] == "n8n_error"
+        assert results[4]["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_batch_size_capped(self, http_client):
+        """More than the allowed number of calls should be rejected outright."""
+        calls = [{"tool": "list_workflows"}] * (_MAX_BATCH_CALLS + 1)
+
+        response = await http_client.post("/call/batch", data=orjson.dumps(calls))
+
+        assert response.status == 400
+        assert str(_MAX_BATCH_CALLS) in (await response.json())["error"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body,error", [
+        (b"[{not json", "Invalid JSON body"),
+        (b'{"tool": "list_workflows"}', "Request body must be a JSON array of calls"),
+    ], ids=["invalid-json", "not-an-array"])
+    async def test_malformed_body(self, http_client, body, error):
+        """Bodies that are not a JSON array should be rejected."""
+        response = await http_client.post("/call/batch", data=body)
+
+        assert response.status == 400
+        assert (await response.json()) == {"error": error}
+
+
+class TestStreamedCall:
+    """Tests for POST /call?stream=1."""
+
+    @pytest.mark.asyncio
+    async def test_records_streamed_one_per_line(self, http_client):
+        """The envelope and then each record should arrive as one NDJSON line."""
+        response = await http_client.post(
+            "/call?stream=1", data=orjson.dumps({"tool": "list_workflows"})
+        )
+
+        assert response.status == 200
+        assert response.content_type == "application/x-ndjson"
+        lines = [orjson.loads(line) for line in (await response.read()).splitlines()]
+        header, *records = lines
+        assert header["success"] is True
+        assert header["stream"] == "workflows"
+        assert header["data"]["total_count"] == 2
+        assert "workflows" not in header["data"]
+        assert [record["id"] for record in records] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_error_mid_stream_ends_with_error_line(self, http_client, n8n_stub):
+        """A record that cannot be serialized should end the stream with an error."""
+        # orjson cannot serialize sets, so the second record fails
+        n8n_stub.workflows[1] = {**_WORKFLOWS[1], "tags": {"test"}}
+
+        response = await http_client.post(
+            "/call?stream=1", data=orjson.dumps({"tool": "list_workflows"})
+        )
+
+        assert response.status == 200
+        lines = [orjson.loads(line) for line in (await response.read()).splitlines()]
+        assert len(lines) == 3
+        assert lines[1]["id"] == "1"
+        assert "error" in lines[2]
+
+    @pytest.mark.asyncio
+    async def test_result_without_records_is_buffered(self, http_client):
+        """Results without a record list should fall back to one JSON document."""
+        response = await http_client.post(
+            "/call?stream=1",
+            data=orjson.dumps({"tool": "get_workflow_details", "arguments": {"workflow_id": "1"}})
+        )
+
+        assert response.status == 200
+        assert response.content_type == "application/json"
+        assert (await response.json())["data"]["id"] == "1"